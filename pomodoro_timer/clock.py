@@ -0,0 +1,27 @@
+import os
+import time
+
+# Benchmarks set POMODORO_CLOCK_SCALE (e.g. 60) so a 25-minute session plays
+# out in well under a minute; normal runs use real time.
+SCALE = float(os.environ.get("POMODORO_CLOCK_SCALE") or 1)
+
+_origin_monotonic = time.monotonic()
+_origin_time = time.time()
+
+
+def monotonic() -> float:
+    return _origin_monotonic + (time.monotonic() - _origin_monotonic) * SCALE
+
+
+def now() -> float:
+    """Wall-clock seconds since the epoch, running SCALE times faster than real time."""
+    return _origin_time + (time.time() - _origin_time) * SCALE
+
+
+def sleep(seconds: float) -> None:
+    time.sleep(seconds / SCALE)
+
+
+def to_real(seconds: float) -> float:
+    """Convert a duration on this clock into real seconds, e.g. for select() timeouts."""
+    return seconds / SCALE
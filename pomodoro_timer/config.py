@@ -1,4 +1,12 @@
 import argparse
+from datetime import date
+
+
+def _parse_date(text: str) -> date:
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a date like 2026-01-31, got {text!r}") from None
 
 
 class PomodoroConfig:
@@ -7,9 +15,24 @@ class PomodoroConfig:
         self.short_break_mins = 5
         self.long_break_mins = 15
         self.number_of_cycles = 4
+        self.sets = 0
+        self.auto_continue = False
         self.theme = "default"
         self.color = "pink"
         self.show_stats = False
+        self.live_stats = False
+        self.daemon = False
+        self.control_command = None
+        self.name = None
+        self.display = "full"
+        self.retention_days = 0
+        self.metrics_file = None
+        self.query = False
+        self.query_from = None
+        self.query_to = None
+        self.group_by = "day"
+        self.output_format = "table"
+        self.sync_dir = None
 
     @classmethod
     def from_args(cls):
@@ -59,13 +82,112 @@ class PomodoroConfig:
             metavar="NUMBER",
             help="Number of work/break cycles before long break (default: 4)"
         )
+        parser.add_argument(
+            "--display",
+            default=self.display,
+            choices=["full", "compact", "plain"],
+            help="full: full-screen timer; compact: a single updating status line; "
+                 "plain: one line per phase event (used automatically when output isn't a terminal)"
+        )
+        parser.add_argument(
+            "--sets",
+            type=int,
+            default=self.sets,
+            metavar="NUMBER",
+            help="Stop after this many full sets of cycles (default: 0, no limit)"
+        )
+        parser.add_argument(
+            "--auto-continue",
+            action="store_true",
+            help="Start the next set automatically instead of asking"
+        )
         parser.add_argument(
             "--stats",
             action="store_true",
             help="View session statistics instead of starting timer"
         )
+        parser.add_argument(
+            "--live",
+            action="store_true",
+            help="Keep the statistics view updated as sessions are recorded elsewhere"
+        )
+        parser.add_argument(
+            "--query",
+            action="store_true",
+            help="Print statistics for scripts instead of opening the stats screen"
+        )
+        parser.add_argument(
+            "--from",
+            dest="query_from",
+            type=_parse_date,
+            metavar="YYYY-MM-DD",
+            help="With --query, first day to include (default: the first recorded session)"
+        )
+        parser.add_argument(
+            "--to",
+            dest="query_to",
+            type=_parse_date,
+            metavar="YYYY-MM-DD",
+            help="With --query, last day to include (default: today)"
+        )
+        parser.add_argument(
+            "--group-by",
+            default=self.group_by,
+            choices=["day", "week", "month", "type"],
+            help="With --query, how to group sessions (default: day)"
+        )
+        parser.add_argument(
+            "--format",
+            dest="output_format",
+            default=self.output_format,
+            choices=["table", "json", "csv"],
+            help="With --query, output format (default: table)"
+        )
+        parser.add_argument(
+            "--sync-dir",
+            metavar="PATH",
+            help="Share sessions with your other devices through this folder (remembered; 'off' to stop)"
+        )
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=self.retention_days,
+            metavar="DAYS",
+            help="Keep full session detail for this many days, then only daily totals (default: 0, keep everything)"
+        )
+        parser.add_argument(
+            "--metrics-file",
+            metavar="PATH",
+            help="Keep a Prometheus textfile of session counts, the current phase and timings at PATH"
+        )
+        parser.add_argument(
+            "--daemon",
+            action="store_true",
+            help="Run the timer headless in the background, controlled with --control"
+        )
+        parser.add_argument(
+            "--control",
+            choices=["status", "pause", "resume", "skip", "start", "stop", "add", "remove", "list"],
+            metavar="COMMAND",
+            help="Send a command to the background timer: status, pause, resume, skip, start, stop, "
+                 "or add/remove/list named timers"
+        )
+        parser.add_argument(
+            "--name",
+            metavar="NAME",
+            help="Named timer to control, and whose separate statistics to record or view"
+        )
+        parser.add_argument(
+            "--status",
+            action="store_true",
+            help="Print the background timer's phase and remaining time for status bars"
+        )
 
         args = parser.parse_args()
+        if args.retention_days < 0:
+            parser.error("--retention-days must be 0 or more")
+        if args.query_from and args.query_to and args.query_from > args.query_to:
+            parser.error("--from must not be after --to")
 
         self.theme = args.theme
         self.color = args.color
@@ -73,4 +195,19 @@ class PomodoroConfig:
         self.short_break_mins = args.short_break
         self.long_break_mins = args.long_break
         self.number_of_cycles = args.cycles
+        self.sets = args.sets
+        self.auto_continue = args.auto_continue
         self.show_stats = args.stats
+        self.live_stats = args.live
+        self.daemon = args.daemon
+        self.control_command = args.control
+        self.name = args.name
+        self.display = args.display
+        self.retention_days = args.retention_days
+        self.metrics_file = args.metrics_file
+        self.query = args.query
+        self.query_from = args.query_from
+        self.query_to = args.query_to
+        self.group_by = args.group_by
+        self.output_format = args.output_format
+        self.sync_dir = args.sync_dir
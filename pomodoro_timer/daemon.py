@@ -0,0 +1,261 @@
+import json
+import os
+import selectors
+import socket
+import time
+from pathlib import Path
+from typing import Optional
+
+from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.metrics import MetricsExporter
+from pomodoro_timer.scheduler import TimerScheduler
+from pomodoro_timer.sound_manager import SoundManager
+from pomodoro_timer.statistics import StatisticsManager
+from pomodoro_timer.status_file import StatusWriter
+from pomodoro_timer.storage import StorageManager
+from pomodoro_timer.sync import SyncManager
+from pomodoro_timer.timer_state import TimerState
+
+
+SOCKET_FILE = "daemon.sock"
+DEFAULT_TIMER = "default"
+
+
+class PomodoroDaemon:
+    """Runs Pomodoro timers headless, controlled over a Unix domain socket.
+
+    The main timer ("default", or the --name the daemon was started with)
+    records to the daemon's statistics and drives the status file; any other
+    named timers added with ``add NAME`` record to their own stats namespace.
+    """
+
+    def __init__(
+            self,
+            config: PomodoroConfig,
+            storage_manager: StorageManager,
+            statistics_manager: StatisticsManager,
+            sound_manager: Optional[SoundManager] = None,
+            metrics: Optional[MetricsExporter] = None,
+            sync_manager: Optional[SyncManager] = None,
+    ):
+        self.config = config
+        self.socket_path = storage_manager.get_file_path(SOCKET_FILE)
+        self.statistics_manager = statistics_manager
+        self.scheduler = TimerScheduler(config)
+        self.main_timer = config.name or DEFAULT_TIMER
+        self.sound_manager = sound_manager
+        self.metrics = metrics
+        self.sync_manager = sync_manager
+        self.selector = selectors.DefaultSelector()
+        self.status_writer: Optional[StatusWriter] = None
+        self.server: Optional[socket.socket] = None
+        self.running = False
+
+    def open(self) -> None:
+        """Claim the control socket; raises RuntimeError if another daemon owns it."""
+        self.server = self._bind_socket()
+
+    def run(self) -> None:
+        if self.server is None:
+            self.open()
+        self.status_writer = StatusWriter()
+        self.selector.register(self.server, selectors.EVENT_READ)
+        self.scheduler.add(self.main_timer, time.time(), statistics_manager=self.statistics_manager,
+                           sync_manager=self.sync_manager)
+        self._publish_status()
+        if self.metrics:
+            self._update_metrics()
+        self.running = True
+
+        try:
+            while self.running:
+                # Sleep until the earliest phase ends or a client connects; no per-second wakeups
+                deadline = self.scheduler.next_deadline()
+                timeout = None if deadline is None else max(0.0, deadline - time.time())
+                if self.metrics:
+                    timeout = self.metrics.interval if timeout is None else min(timeout, self.metrics.interval)
+                if self.scheduler.sync_managers:
+                    # Wake up now and then to import sessions recorded on other devices
+                    until_merge = max(0.0, self.scheduler.next_merge - time.time())
+                    timeout = until_merge if timeout is None else min(timeout, until_merge)
+
+                for key, _ in self.selector.select(timeout):
+                    if key.fileobj is self.server:
+                        self._accept()
+                    else:
+                        self._handle_client(key.fileobj)
+
+                for name, finished in self.scheduler.run_due(time.time()):
+                    if name == self.main_timer and finished:
+                        self._publish_status()
+                        if self.sound_manager:
+                            self.sound_manager.play_notification()
+
+                if self.metrics and self.running:
+                    self._update_metrics()
+                self.scheduler.merge_synced(time.time())
+        finally:
+            self._shutdown()
+
+    def handle_command(self, command: str) -> dict:
+        """Run a ``COMMAND [NAME]`` request; NAME defaults to the default timer."""
+        now = time.time()
+        parts = command.split()
+        if not parts:
+            return {"ok": False, "error": "empty command"}
+        action, name = parts[0], parts[1] if len(parts) > 1 else self.main_timer
+
+        try:
+            if action == "list":
+                return {"ok": True, "timers": {
+                    timer_name: self._status(timer_name, now) for timer_name in self.scheduler.timers
+                }}
+            elif action == "add":
+                self.scheduler.add(name, now)
+                ok = True
+            elif action == "remove":
+                if name == self.main_timer:
+                    return {"ok": False, "error": f"{name!r} is the main timer; use stop to end the daemon"}
+                self.scheduler.remove(name, now)
+                return {"ok": True}
+            elif action == "status":
+                self.scheduler.get(name)
+                ok = True
+            elif action == "pause":
+                ok = self.scheduler.pause(name, now)
+            elif action == "resume":
+                ok = self.scheduler.resume(name, now)
+            elif action == "skip":
+                ok = self.scheduler.skip(name, now)
+            elif action == "start":
+                self.scheduler.restart(name, now)
+                ok = True
+            elif action == "stop":
+                if name != self.main_timer:
+                    return {"ok": False, "error": f"stop ends the whole daemon; use remove {name} to end one timer"}
+                for timer_name in list(self.scheduler.timers):
+                    self.scheduler.remove(timer_name, now)
+                self.running = False
+                return {"ok": True, "state": "quit"}
+            else:
+                return {"ok": False, "error": f"unknown command {command!r}"}
+        except (KeyError, ValueError) as e:
+            return {"ok": False, "error": str(e.args[0])}
+
+        if name == self.main_timer:
+            self._publish_status()
+        return {"ok": ok, **self._status(name, now)}
+
+    def _status(self, name: str, now: float) -> dict:
+        cycle = self.scheduler.get(name)
+        return {
+            "name": name,
+            "state": cycle.state.name.lower(),
+            "phase": cycle.session_type,
+            "cycle": cycle.cycle_number,
+            "total_cycles": cycle.config.number_of_cycles,
+            "remaining": round(cycle.remaining(now), 1),
+        }
+
+    def _publish_status(self) -> None:
+        cycle = self.scheduler.get(self.main_timer)
+        state = {
+            TimerState.RUNNING: "running",
+            TimerState.PAUSED: "paused",
+            TimerState.COMPLETED: "completed",
+        }.get(cycle.state, "idle")
+
+        self.status_writer.publish(
+            state,
+            phase=cycle.session_type,
+            cycle=cycle.cycle_number,
+            total_cycles=cycle.config.number_of_cycles,
+            deadline=cycle.deadline or 0.0,
+            remaining=cycle.remaining(time.time()),
+            duration=cycle.duration_seconds,
+        )
+
+    def _update_metrics(self) -> None:
+        cycle = self.scheduler.get(self.main_timer)
+        state = {TimerState.RUNNING: "running", TimerState.PAUSED: "paused"}.get(cycle.state, "idle")
+        self.metrics.set_phase(state, cycle.session_type, cycle.remaining(time.time()))
+
+    def _bind_socket(self) -> socket.socket:
+        path = str(self.socket_path)
+        if self.socket_path.exists():
+            try:
+                send_command("status", self.socket_path)
+            except OSError:
+                self.socket_path.unlink()  # Left behind by a daemon that didn't shut down cleanly
+            else:
+                raise RuntimeError(f"A Pomodoro daemon is already listening on {path}")
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        os.chmod(path, 0o600)
+        server.listen()
+        server.setblocking(False)
+        return server
+
+    def _accept(self) -> None:
+        conn, _ = self.server.accept()
+        conn.setblocking(False)
+        self.selector.register(conn, selectors.EVENT_READ)
+
+    def _handle_client(self, conn: socket.socket) -> None:
+        try:
+            data = conn.recv(1024)
+        except (BlockingIOError, ConnectionError):
+            data = b""
+
+        if data:
+            reply = self.handle_command(data.decode("utf-8", "replace").strip())
+            try:
+                conn.sendall((json.dumps(reply) + "\n").encode("utf-8"))
+            except OSError:
+                pass
+
+        self.selector.unregister(conn)
+        conn.close()
+
+    def _shutdown(self) -> None:
+        for key in list(self.selector.get_map().values()):
+            key.fileobj.close()
+        self.selector.close()
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        if self.status_writer:
+            self.status_writer.close()
+        if self.metrics:
+            self.metrics.close()
+
+
+def send_command(command: str, socket_path: Path) -> dict:
+    """Send one command to a running daemon and return its JSON reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(2)
+        client.connect(str(socket_path))
+        client.sendall(command.encode("utf-8") + b"\n")
+
+        reply = b""
+        while not reply.endswith(b"\n"):
+            chunk = client.recv(4096)
+            if not chunk:
+                break
+            reply += chunk
+
+    return json.loads(reply) if reply else {}
+
+
+def detach() -> None:
+    """Fork into the background, detached from the controlling terminal."""
+    if os.fork() > 0:
+        os._exit(0)
+    os.setsid()
+    if os.fork() > 0:
+        os._exit(0)
+
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    os.close(devnull)
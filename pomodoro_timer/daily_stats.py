@@ -0,0 +1,123 @@
+from datetime import date, datetime, timedelta
+
+from pomodoro_timer.retention import SESSION_TYPES, is_summary
+from pomodoro_timer.storage import StorageManager
+
+
+class DailyStatsCache:
+    """Per-day session aggregates, built once per shard and then updated from appended lines only."""
+
+    def __init__(self, storage_manager: StorageManager) -> None:
+        self.storage_manager = storage_manager
+        self.days: dict[date, dict] = {}
+        self._offsets: dict[str, int] = {}
+        self._inodes: dict[str, int] = {}
+        self._covered = False
+        self._covered_start: datetime | None = None
+
+    def ensure_loaded(self, start_date: datetime = None) -> None:
+        """Make sure every shard overlapping [start_date, now] has been folded in."""
+        for key in self.storage_manager.list_shards(start_date):
+            if key not in self._offsets:
+                self._load_shard(key)
+
+        if not self._covered or (self._covered_start and (start_date is None or start_date < self._covered_start)):
+            self._covered_start = start_date
+        self._covered = True
+
+    def ensure_range_loaded(self, start_date: datetime, end_date: datetime) -> None:
+        """Fold in only the shards overlapping [start_date, end_date], e.g. a visible calendar window."""
+        for key in self.storage_manager.list_shards(start_date, end_date):
+            if key not in self._offsets:
+                self._load_shard(key)
+
+    def refresh(self) -> int:
+        """Fold in sessions appended since the last call and return how many were new."""
+        keys = set(self._offsets)
+        if self._covered:
+            keys.update(self.storage_manager.list_shards(self._covered_start))
+
+        new_sessions = 0
+        for key in sorted(keys):
+            if key in self._offsets:
+                stat = self.storage_manager.get_shard_stat(key)
+                size = stat.st_size if stat else 0
+                inode = stat.st_ino if stat else None
+                if size == self._offsets[key] and inode == self._inodes[key]:
+                    continue
+                if size < self._offsets[key] or inode != self._inodes[key]:
+                    # The shard was rewritten (e.g. compacted) rather than appended to
+                    self._drop_shard(key)
+                    new_sessions += self._load_shard(key)
+                    continue
+                sessions, self._offsets[key] = self.storage_manager.read_shard_from(key, self._offsets[key])
+                new_sessions += self._fold(sessions)
+            else:
+                # A shard appeared inside the range we cover (e.g. a new month started)
+                new_sessions += self._load_shard(key)
+
+        return new_sessions
+
+    def totals(self, start_date: datetime = None) -> dict:
+        start_day = start_date.date() if start_date else None
+        totals = {session_type: 0 for session_type in SESSION_TYPES}
+        totals["total"] = 0
+        totals["work_minutes"] = 0
+
+        for day, bucket in self.days.items():
+            if start_day and day < start_day:
+                continue
+            for key, value in bucket.items():
+                totals[key] = totals.get(key, 0) + value
+
+        # Summing per session or per summarized day gives the same minutes up to float noise
+        totals["work_minutes"] = round(totals["work_minutes"], 2)
+        return totals
+
+    def work_minutes_by_day(self, start_day: date, end_day: date) -> dict[date, float]:
+        """Work minutes for each day in [start_day, end_day], looked up day by day."""
+        minutes = {}
+        day = start_day
+        while day <= end_day:
+            bucket = self.days.get(day)
+            minutes[day] = round(bucket["work_minutes"], 2) if bucket else 0
+            day += timedelta(days=1)
+        return minutes
+
+    def _load_shard(self, key: str) -> int:
+        stat = self.storage_manager.get_shard_stat(key)
+        self._inodes[key] = stat.st_ino if stat else None
+        sessions, self._offsets[key] = self.storage_manager.read_shard_from(key, 0)
+        return self._fold(sessions)
+
+    def _drop_shard(self, key: str) -> None:
+        shard_start, shard_end = self.storage_manager.shard_bounds(key)
+        for day in [day for day in self.days if shard_start.date() <= day < shard_end.date()]:
+            del self.days[day]
+        del self._offsets[key]
+        del self._inodes[key]
+
+    def _fold(self, sessions: list) -> int:
+        for session in sessions:
+            day = datetime.fromisoformat(session["date"]).date()
+            bucket = self.days.get(day)
+            if bucket is None:
+                bucket = {session_type: 0 for session_type in SESSION_TYPES}
+                bucket["total"] = 0
+                bucket["work_minutes"] = 0
+                self.days[day] = bucket
+
+            if is_summary(session):
+                # A day past the retention cutoff, already reduced to per-type counts
+                for session_type, count in session["counts"].items():
+                    bucket[session_type] = bucket.get(session_type, 0) + count
+                    bucket["total"] += count
+                bucket["work_minutes"] += session["minutes"].get("work", 0)
+                continue
+
+            bucket[session["type"]] = bucket.get(session["type"], 0) + 1
+            bucket["total"] += 1
+            if session["type"] == "work":
+                bucket["work_minutes"] += session["duration"]
+
+        return len(sessions)
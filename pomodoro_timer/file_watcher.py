@@ -0,0 +1,88 @@
+import ctypes
+import ctypes.util
+import os
+import sys
+import time
+from pathlib import Path
+
+
+class FileWatcher:
+    """Reports changes inside a directory, using inotify on Linux and mtime polling elsewhere."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+
+    def __init__(self, path: Path, poll_interval: float = 1.0):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.poll_interval = poll_interval
+        self._last_poll = 0.0
+        self._fd = self._init_inotify()
+        self._snapshot = self._take_snapshot() if self._fd is None else {}
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._fd is not None
+
+    def has_changed(self) -> bool:
+        """Non-blocking check for changes since the previous call."""
+        if self._fd is not None:
+            return self._drain_inotify()
+
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval:
+            return False
+        self._last_poll = now
+
+        snapshot = self._take_snapshot()
+        changed = snapshot != self._snapshot
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _init_inotify(self):
+        if not sys.platform.startswith('linux'):
+            return None
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return None
+
+            mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+            if libc.inotify_add_watch(fd, os.fsencode(self.path), mask) < 0:
+                os.close(fd)
+                return None
+            return fd
+        except (OSError, AttributeError):
+            return None
+
+    def _drain_inotify(self) -> bool:
+        changed = False
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            changed = True
+        return changed
+
+    def _take_snapshot(self) -> dict:
+        snapshot = {}
+        try:
+            with os.scandir(self.path) as entries:
+                for entry in entries:
+                    stat = entry.stat()
+                    snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            pass
+        return snapshot
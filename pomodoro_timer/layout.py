@@ -0,0 +1,84 @@
+import curses
+
+from _curses import window
+
+
+class CountdownLayout:
+    """Positions of every countdown screen element for one terminal size."""
+
+    ASCII_TIMER_HEIGHT = 6
+    PROGRESS_BAR_HEIGHT = 3
+    SPACING = 4
+
+    def __init__(self, height: int, width: int, static_lines: list):
+        self.height = height
+        self.width = width
+        self.static_lines = [line.rstrip() for line in static_lines]
+        self.progress_bar_width = max(1, min(60, width - 20))
+
+        static_height = len(static_lines)
+        total_layout_height = (static_height + self.SPACING + self.ASCII_TIMER_HEIGHT
+                               + self.SPACING + self.PROGRESS_BAR_HEIGHT)
+        self.start_y = max(0, (height - total_layout_height) // 2)
+
+        max_static_width = max(len(line) for line in self.static_lines) if self.static_lines else 0
+        self.static_x = max(0, (width - max_static_width) // 2)
+
+        self.timer_y = self.start_y + static_height + 2
+        self.milestone_y = self.timer_y + self.ASCII_TIMER_HEIGHT + 2
+        self.progress_y = self.milestone_y
+        self.progress_with_milestone_y = self.milestone_y + 2
+
+        self.controls_y = height - 2
+        self._centered_x: dict[int, int] = {}
+
+    def center_x(self, text_width: int) -> int:
+        """Column that centers a block of the given width, memoized per width."""
+        x = self._centered_x.get(text_width)
+        if x is None:
+            x = max(0, (self.width - text_width) // 2)
+            self._centered_x[text_width] = x
+        return x
+
+    def shows_controls(self, progress_y: int) -> bool:
+        return self.controls_y > progress_y + 3
+
+    def visible(self, y: int) -> bool:
+        return 0 <= y < self.height
+
+
+class LayoutEngine:
+    """Caches screen layouts per terminal size and rebuilds them only after a resize."""
+
+    def __init__(self, stdscr: window):
+        self.stdscr = stdscr
+        self.height, self.width = stdscr.getmaxyx()
+        self._countdown_layouts: dict[tuple, CountdownLayout] = {}
+        self._block_origins: dict[tuple, tuple[int, int]] = {}
+
+    def handle_resize(self) -> None:
+        """Pick up the new terminal size (after KEY_RESIZE / SIGWINCH) and drop stale layouts."""
+        curses.update_lines_cols()
+        self.height, self.width = self.stdscr.getmaxyx()
+        self._countdown_layouts.clear()
+        self._block_origins.clear()
+
+    def countdown_layout(self, static_content: str) -> CountdownLayout:
+        key = (self.height, self.width, static_content)
+        layout = self._countdown_layouts.get(key)
+        if layout is None:
+            layout = CountdownLayout(self.height, self.width, static_content.split('\n'))
+            self._countdown_layouts[key] = layout
+        return layout
+
+    def block_origin(self, line_count: int, max_line_width: int, y_offset: int = 0) -> tuple[int, int]:
+        """Top-left corner that centers a block of text on the screen."""
+        key = (self.height, self.width, line_count, max_line_width, y_offset)
+        origin = self._block_origins.get(key)
+        if origin is None:
+            origin = (
+                max(0, (self.height - line_count) // 2 + y_offset),
+                max(0, (self.width - max_line_width) // 2),
+            )
+            self._block_origins[key] = origin
+        return origin
@@ -0,0 +1,253 @@
+import math
+import os
+import select
+import sys
+import time
+from datetime import datetime
+from typing import Optional, TextIO
+
+from pomodoro_timer import clock
+from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.metrics import MetricsExporter
+from pomodoro_timer.pomodoro_cycle import PomodoroCycle
+from pomodoro_timer.progress_bar import ProgressBar
+from pomodoro_timer.sound_manager import SoundManager
+from pomodoro_timer.statistics import StatisticsManager
+from pomodoro_timer.theme_manager import ThemeManager
+from pomodoro_timer.timer_state import TimerState
+
+
+PHASE_LABELS = {"work": "Work", "short_break": "Short break", "long_break": "Long break"}
+
+
+class StatusLineRenderer:
+    """Keeps a single self-overwriting terminal line, emitting only the characters that changed.
+
+    The line must be plain single-width text: cursor movement is counted in
+    characters, so wide glyphs like emoji would throw the columns off.
+    """
+
+    def __init__(self, stream: TextIO, color_code: str = ""):
+        self.stream = stream
+        self.color_code = color_code
+        self.current = ""
+        self.cursor = 0
+        self.bytes_written = 0
+
+    def render(self, line: str) -> None:
+        old = self.current
+        if line == old:
+            return
+
+        out = self.color_code if not old else ""
+
+        prefix = 0
+        limit = min(len(old), len(line))
+        while prefix < limit and old[prefix] == line[prefix]:
+            prefix += 1
+
+        if len(line) == len(old):
+            # Same length: rewrite only the changed span, e.g. the last digit of the clock
+            end = len(line)
+            while end > prefix and old[end - 1] == line[end - 1]:
+                end -= 1
+            out += self._move(line, self.cursor, prefix) + line[prefix:end]
+            self.cursor = end
+        else:
+            out += self._move(line, self.cursor, prefix) + line[prefix:]
+            if len(line) < len(old):
+                out += "\033[K"
+            self.cursor = len(line)
+
+        self._write(out)
+        self.current = line
+
+    def finish(self, reset: str = "") -> None:
+        """Move past the status line so later output starts on a fresh line."""
+        if self.current:
+            self._write(reset + "\n")
+        self.current = ""
+        self.cursor = 0
+
+    def _move(self, line: str, column: int, target: int) -> str:
+        """Shortest way to move the cursor from `column` to `target` within an unchanged prefix."""
+        if target < column:
+            backspaces = "\b" * (column - target)
+            absolute = "\r" + (f"\033[{target}C" if target else "")
+            return backspaces if len(backspaces) <= len(absolute) else absolute
+        if target > column:
+            # Re-printing a few unchanged characters is cheaper than an escape sequence
+            forward = f"\033[{target - column}C"
+            unchanged = line[column:target]
+            return unchanged if len(unchanged.encode("utf-8")) <= len(forward) else forward
+        return ""
+
+    def _write(self, text: str) -> None:
+        self.stream.write(text)
+        self.stream.flush()
+        self.bytes_written += len(text.encode("utf-8"))
+
+
+class PlainEventWriter:
+    """Writes one log-friendly line per phase event, for output that isn't a terminal."""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def event(self, cycle: PomodoroCycle, event: str) -> None:
+        timestamp = datetime.now().isoformat(timespec="seconds")
+        phase = PHASE_LABELS.get(cycle.session_type, cycle.session_type)
+        minutes = cycle.duration_seconds // 60
+        self.stream.write(
+            f"{timestamp} {event} {phase} {cycle.cycle_number}/{cycle.config.number_of_cycles} ({minutes} min)\n"
+        )
+        self.stream.flush()
+
+
+class LineTimer:
+    """Runs the Pomodoro cycle without curses, as a status line or as plain event lines."""
+
+    def __init__(
+            self,
+            config: PomodoroConfig,
+            theme_manager: ThemeManager,
+            sound_manager: SoundManager,
+            statistics_manager: StatisticsManager,
+            stream: TextIO = sys.stdout,
+            metrics: Optional[MetricsExporter] = None,
+    ):
+        self.config = config
+        self.theme_manager = theme_manager
+        self.sound_manager = sound_manager
+        self.cycle = PomodoroCycle(config, statistics_manager)
+        self.stream = stream
+        self.metrics = metrics
+        self.compact = config.display == "compact"
+        self.progress_bar = ProgressBar(width=20)
+
+        if self.compact:
+            self.line = StatusLineRenderer(stream, theme_manager.get_ansi_color_code(config.color))
+        self.events = PlainEventWriter(stream)
+
+    def start(self) -> None:
+        with _KeyReader(enabled=self.compact) as keys:
+            try:
+                self._run(keys)
+            except KeyboardInterrupt:
+                self.cycle.stop(clock.now())
+                self._announce("stopped")
+
+    def _run(self, keys: "_KeyReader") -> None:
+        self.cycle.start(clock.now())
+        self._announce("started")
+
+        while self.cycle.state in (TimerState.RUNNING, TimerState.PAUSED):
+            now = clock.now()
+            if self.compact:
+                render_started = time.perf_counter()
+                self.line.render(self._status_line(now))
+                if self.metrics:
+                    self.metrics.observe_render(time.perf_counter() - render_started)
+            if self.metrics:
+                state = "paused" if self.cycle.state == TimerState.PAUSED else "running"
+                self.metrics.set_phase(state, self.cycle.session_type, self.cycle.remaining(now))
+
+            key = keys.wait(self._next_wakeup(now))
+            now = clock.now()
+
+            if key in ("p", "P"):
+                if self.cycle.pause(now):
+                    self._announce("paused")
+                elif self.cycle.resume(now):
+                    self._announce("resumed")
+            elif key in ("s", "S"):
+                if self.cycle.skip(now) and self.cycle.state == TimerState.RUNNING:
+                    self._announce("started")
+            elif key in ("q", "Q"):
+                self.cycle.stop(now)
+                self._announce("stopped")
+                return
+
+            if self.cycle.advance(now):
+                self.sound_manager.play_notification()
+                if self.cycle.state == TimerState.RUNNING:
+                    self._announce("started")
+
+        self._announce("completed")
+
+    def _next_wakeup(self, now: float) -> Optional[float]:
+        """Seconds until the displayed countdown next changes (or the phase ends)."""
+        if self.cycle.state != TimerState.RUNNING:
+            return None
+        if not self.compact:
+            wakeup = max(0.0, self.cycle.deadline - now)
+            # Wake up now and then anyway so the metrics file's remaining time stays fresh
+            return min(wakeup, self.metrics.interval) if self.metrics else wakeup
+
+        remaining = self.cycle.remaining(now)
+        shown = math.ceil(remaining)
+        return max(0.0, remaining - (shown - 1))
+
+    def _status_line(self, now: float) -> str:
+        remaining = self.cycle.remaining(now)
+        mins, secs = divmod(math.ceil(remaining), 60)
+        total = self.cycle.duration_seconds
+        bar = self.progress_bar.render(total - math.ceil(remaining), total)
+
+        label = PHASE_LABELS.get(self.cycle.session_type, self.cycle.session_type)
+        if self.cycle.state == TimerState.PAUSED:
+            label += " (paused)"
+        position = f"{self.cycle.cycle_number}/{self.config.number_of_cycles}"
+        return f"{label} {position}  {mins:02d}:{secs:02d}  {bar}"
+
+    def _announce(self, event: str) -> None:
+        if self.compact:
+            if event in ("started", "paused", "resumed"):
+                return  # The status line itself shows these
+            self.line.finish(self.theme_manager.reset)
+            message = "Pomodoro session complete!" if event == "completed" else "Timer stopped."
+            self.stream.write(self.theme_manager.apply_ansi_color(message, self.line.color_code) + "\n")
+            self.stream.flush()
+        elif event == "completed":
+            self.stream.write(f"{datetime.now().isoformat(timespec='seconds')} completed all cycles\n")
+            self.stream.flush()
+        else:
+            self.events.event(self.cycle, event)
+
+
+class _KeyReader:
+    """Reads single keypresses from a terminal in cbreak mode, or just sleeps when disabled."""
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled and sys.stdin.isatty()
+        self._saved_attrs = None
+
+    def __enter__(self) -> "_KeyReader":
+        if self.enabled:
+            import termios
+            import tty
+
+            self._saved_attrs = termios.tcgetattr(sys.stdin)
+            tty.setcbreak(sys.stdin)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._saved_attrs is not None:
+            import termios
+
+            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self._saved_attrs)
+
+    def wait(self, timeout: Optional[float]) -> str:
+        """Wait up to `timeout` seconds (forever if None) and return a pressed key, or ''."""
+        if not self.enabled:
+            if timeout is None:
+                # Paused with no way to resume from a non-interactive stream
+                raise KeyboardInterrupt
+            clock.sleep(timeout)
+            return ""
+
+        real_timeout = None if timeout is None else clock.to_real(timeout)
+        ready, _, _ = select.select([sys.stdin], [], [], real_timeout)
+        if ready:
+            return os.read(sys.stdin.fileno(), 1).decode("utf-8", "ignore")
+        return ""
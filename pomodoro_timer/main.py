@@ -1,31 +1,117 @@
-import curses
+import sys
+
+from pomodoro_timer.status_file import STATUS_FLAG, print_status
 
-from pomodoro_timer.config import PomodoroConfig
-from pomodoro_timer.sound_manager import SoundManager
-from pomodoro_timer.statistics import StatisticsManager
-from pomodoro_timer.statistics_ui import StatisticsUI
-from pomodoro_timer.storage import StorageManager
-from pomodoro_timer.theme_manager import ThemeManager
-from pomodoro_timer.timer import PomodoroTimer
 
 def main():
+    # Status bars poll this every second, so answer straight from the status
+    # file before importing curses or any of the timer machinery.
+    if STATUS_FLAG in sys.argv[1:]:
+        sys.exit(print_status())
+
+    run_app()
+
+
+def run_app():
+    import json
+
+    from pomodoro_timer.config import PomodoroConfig
+
     config: PomodoroConfig = PomodoroConfig.from_args()
+    if config.query:
+        # Scripts and shell prompts run this often: skip curses and sound entirely
+        from pomodoro_timer.query import run_query
+
+        sys.exit(run_query(config))
+
+    import curses
+
+    from pomodoro_timer.sound_manager import SoundManager
+    from pomodoro_timer.statistics import StatisticsManager
+    from pomodoro_timer.statistics_ui import StatisticsUI
+    from pomodoro_timer.storage import StorageManager
+    from pomodoro_timer.theme_manager import ThemeManager
+    from pomodoro_timer.timer import PomodoroTimer
+
     theme_manager = ThemeManager()
     sound_manager = SoundManager()
-    storage_manager = StorageManager()
-    statistics_manager = StatisticsManager(storage_manager)
+    try:
+        storage_manager = StorageManager(namespace=config.name if not config.control_command else None)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+    statistics_manager = StatisticsManager(storage_manager, retention_days=config.retention_days)
+    sync_manager = None
+    if not config.control_command:
+        from pomodoro_timer.sync import start_sync
+
+        sync_manager = start_sync(statistics_manager, config.sync_dir, compact=not config.daemon)
+
+    metrics = None
+    if config.metrics_file and not config.control_command and not config.show_stats:
+        from pomodoro_timer.metrics import MetricsExporter
+
+        metrics = MetricsExporter(config.metrics_file)
+        statistics_manager.add_listener(metrics.observe_session)
 
-    if config.show_stats:
-        stats_ui = StatisticsUI(statistics_manager, theme_manager, config)
+    if config.control_command:
+        from pomodoro_timer.daemon import SOCKET_FILE, send_command
+
+        try:
+            command = f"{config.control_command} {config.name}" if config.name else config.control_command
+            reply = send_command(command, storage_manager.get_file_path(SOCKET_FILE))
+        except OSError as e:
+            print(f"Could not reach the Pomodoro daemon: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps(reply))
+    elif config.daemon:
+        from pomodoro_timer.daemon import PomodoroDaemon, detach
+
+        daemon = PomodoroDaemon(config, storage_manager, statistics_manager, sound_manager, metrics, sync_manager)
+        try:
+            daemon.open()
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+        detach()
+        # Threads don't survive the fork in detach(), so compact from the daemon itself
+        statistics_manager.start_compaction()
+        daemon.run()
+    elif config.show_stats:
+        stats_ui = StatisticsUI(statistics_manager, theme_manager, config, sync_manager)
         curses.wrapper(stats_ui.run)
+    elif config.display != "full" or not sys.stdout.isatty():
+        from pomodoro_timer.line_display import LineTimer
+
+        if config.display == "full":
+            config.display = "plain"
+        try:
+            LineTimer(config, theme_manager, sound_manager, statistics_manager, metrics=metrics).start()
+        finally:
+            if metrics:
+                metrics.close()
     else:
         timer = PomodoroTimer(
             config,
             theme_manager,
             sound_manager,
-            statistics_manager
+            statistics_manager,
+            metrics
         )
-        timer.start()
+        try:
+            timer.start()
+        finally:
+            if metrics:
+                metrics.close()
+
+    # Only now that curses has given the terminal back
+    warnings = [
+        statistics_manager.compaction_error(),
+        sync_manager and sync_manager.publish_error,
+        metrics and metrics.error,
+    ]
+    for warning in filter(None, warnings):
+        print(f"Warning: {warning}", file=sys.stderr)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
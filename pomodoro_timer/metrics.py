@@ -0,0 +1,136 @@
+"""Focus-time metrics written as a Prometheus textfile, e.g. for node_exporter.
+
+Counters live in memory and are bumped as sessions are recorded and the
+timer ticks; nothing is recomputed from the session history. Like any
+exporter's counters they start from zero when the process starts, which
+``pomodoro_exporter_start_time_seconds`` makes visible to ``rate()``.
+"""
+import time
+from pathlib import Path
+from typing import Optional
+
+from pomodoro_timer.retention import SESSION_TYPES
+from pomodoro_timer.storage import atomic_write
+
+
+WRITE_INTERVAL = 15.0
+
+
+class _LatencySummary:
+    """Count and sum of observed durations, exported as a summary without quantiles."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+
+
+class MetricsExporter:
+    """Keeps timer and session metrics in memory and writes them out atomically.
+
+    The file is rewritten at most every ``interval`` seconds while the timer
+    ticks, and straight away when a session is recorded or the phase changes.
+    """
+
+    def __init__(self, path: str, interval: float = WRITE_INTERVAL) -> None:
+        self.path = Path(path).expanduser()
+        self.interval = interval
+        self.started_at = time.time()
+        self.completed = {session_type: 0 for session_type in SESSION_TYPES}
+        self.partial = {session_type: 0 for session_type in SESSION_TYPES}
+        self.minutes = {session_type: 0.0 for session_type in SESSION_TYPES}
+        self.state = "idle"
+        self.phase = ""
+        self.remaining = 0.0
+        self.render_latency = _LatencySummary()
+        self.persist_latency = _LatencySummary()
+        self.error: Optional[str] = None
+        self._last_write: Optional[float] = None
+
+    def observe_session(self, session: dict, persist_seconds: float) -> None:
+        """Listener for ``StatisticsManager.record_session``."""
+        session_type = session["type"]
+        counts = self.partial if session.get("partial") else self.completed
+        counts[session_type] = counts.get(session_type, 0) + 1
+        self.minutes[session_type] = self.minutes.get(session_type, 0.0) + session["duration"]
+        self.persist_latency.observe(persist_seconds)
+        self.write()
+
+    def observe_render(self, seconds: float) -> None:
+        self.render_latency.observe(seconds)
+
+    def set_phase(self, state: str, phase: str = "", remaining: float = 0.0) -> None:
+        """Record what the timer is doing; `state` is running, paused or idle."""
+        changed = (state, phase) != (self.state, self.phase)
+        self.state, self.phase, self.remaining = state, phase, remaining
+        if changed:
+            self.write()
+        else:
+            self.maybe_write()
+
+    def maybe_write(self) -> bool:
+        if self._last_write is not None and time.monotonic() - self._last_write < self.interval:
+            return False
+        self.write()
+        return True
+
+    def write(self) -> None:
+        """Replace the metrics file in one step, so collectors never read half a file."""
+        self._last_write = time.monotonic()
+        try:
+            # Rewritten every few seconds and regenerated on restart, so not worth an fsync
+            atomic_write(self.path, self.render(), durable=False)
+        except OSError as e:
+            # Written from inside the timer loop, so the caller reports this after the screen is gone
+            if self.error is None:
+                self.error = f"Could not write metrics to {self.path}: {e}"
+
+    def close(self) -> None:
+        self.set_phase("idle")
+        self.write()
+
+    def render(self) -> str:
+        lines = []
+
+        def family(name: str, metric_type: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+        family("pomodoro_sessions_completed_total", "counter", "Sessions that ran their full length.")
+        for session_type, count in self.completed.items():
+            lines.append(f'pomodoro_sessions_completed_total{{type="{session_type}"}} {count}')
+
+        family("pomodoro_sessions_partial_total", "counter", "Sessions that were skipped or quit part way.")
+        for session_type, count in self.partial.items():
+            lines.append(f'pomodoro_sessions_partial_total{{type="{session_type}"}} {count}')
+
+        family("pomodoro_session_minutes_total", "counter", "Minutes recorded across all sessions.")
+        for session_type, minutes in self.minutes.items():
+            lines.append(f'pomodoro_session_minutes_total{{type="{session_type}"}} {round(minutes, 2)}')
+
+        family("pomodoro_phase", "gauge", "1 for the phase the timer is in, 0 otherwise.")
+        for session_type in SESSION_TYPES:
+            active = int(self.state != "idle" and self.phase == session_type)
+            lines.append(f'pomodoro_phase{{phase="{session_type}"}} {active}')
+
+        family("pomodoro_paused", "gauge", "1 while the timer is paused.")
+        lines.append(f"pomodoro_paused {int(self.state == 'paused')}")
+
+        family("pomodoro_remaining_seconds", "gauge", "Seconds left in the current phase.")
+        lines.append(f"pomodoro_remaining_seconds {round(self.remaining, 3) if self.state != 'idle' else 0}")
+
+        for name, summary, help_text in (
+                ("pomodoro_render_duration_seconds", self.render_latency, "Time spent drawing one timer frame."),
+                ("pomodoro_persist_duration_seconds", self.persist_latency, "Time spent saving one session."),
+        ):
+            family(name, "summary", help_text)
+            lines.append(f"{name}_count {summary.count}")
+            lines.append(f"{name}_sum {summary.total:.6f}")
+
+        family("pomodoro_exporter_start_time_seconds", "gauge", "When the counters started from zero.")
+        lines.append(f"pomodoro_exporter_start_time_seconds {self.started_at:.3f}")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,132 @@
+from typing import Optional
+
+from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.statistics import StatisticsManager
+from pomodoro_timer.timer_state import TimerState
+
+
+class PomodoroCycle:
+    """Headless Pomodoro state machine driven by wall-clock deadlines instead of sleeps.
+
+    Callers pass the current time into every method, so the same cycle can be
+    driven by a daemon, a scheduler or a test with a fake clock.
+    """
+
+    def __init__(self, config: PomodoroConfig, statistics_manager: Optional[StatisticsManager] = None):
+        self.config = config
+        self.statistics_manager = statistics_manager
+        self.phases = self._build_phases()
+        self.index = 0
+        self.sets_completed = 0
+        self.state = TimerState.COMPLETED
+        self.deadline: Optional[float] = None
+        self.remaining_at_pause = 0.0
+
+    @property
+    def session_type(self) -> str:
+        return self.phases[self.index][0]
+
+    @property
+    def cycle_number(self) -> int:
+        return self.phases[self.index][2]
+
+    @property
+    def duration_seconds(self) -> int:
+        return self.phases[self.index][1] * 60
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """When this cycle next needs attention, or None while paused or finished."""
+        return self.deadline if self.state == TimerState.RUNNING else None
+
+    def start(self, now: float) -> None:
+        self.index = 0
+        self.sets_completed = 0
+        self.state = TimerState.RUNNING
+        self.deadline = now + self.duration_seconds
+
+    def remaining(self, now: float) -> float:
+        if self.state == TimerState.RUNNING:
+            return max(0.0, self.deadline - now)
+        if self.state == TimerState.PAUSED:
+            return self.remaining_at_pause
+        return 0.0
+
+    def pause(self, now: float) -> bool:
+        if self.state != TimerState.RUNNING:
+            return False
+        self.remaining_at_pause = self.remaining(now)
+        self.state = TimerState.PAUSED
+        return True
+
+    def resume(self, now: float) -> bool:
+        if self.state != TimerState.PAUSED:
+            return False
+        self.deadline = now + self.remaining_at_pause
+        self.state = TimerState.RUNNING
+        return True
+
+    def skip(self, now: float) -> bool:
+        """Jump to the next phase, recording the current one as partial if at least a minute ran."""
+        if self.state not in (TimerState.RUNNING, TimerState.PAUSED):
+            return False
+
+        elapsed_minutes = (self.duration_seconds - self.remaining(now)) / 60
+        if elapsed_minutes >= 1:
+            self._record(self.session_type, elapsed_minutes, partial=True)
+
+        self._next_phase(now)
+        return True
+
+    def stop(self, now: float) -> None:
+        """Quit the cycle, keeping a partial record like the TUI's [Q] Quit Entirely."""
+        if self.state in (TimerState.RUNNING, TimerState.PAUSED):
+            elapsed_minutes = (self.duration_seconds - self.remaining(now)) / 60
+            if elapsed_minutes >= 1:
+                self._record(self.session_type, elapsed_minutes, partial=True)
+        self.state = TimerState.QUIT
+        self.deadline = None
+
+    def advance(self, now: float) -> int:
+        """Complete every phase whose deadline has passed and return how many finished."""
+        finished = 0
+        while self.state == TimerState.RUNNING and now >= self.deadline:
+            self._record(self.session_type, self.phases[self.index][1])
+            finished += 1
+            # Chain from the old deadline rather than `now` so a late wakeup doesn't drift
+            self._next_phase(self.deadline)
+        return finished
+
+    def _next_phase(self, phase_start: float) -> None:
+        if self.index + 1 >= len(self.phases):
+            self.sets_completed += 1
+            if not self._continues():
+                self.state = TimerState.COMPLETED
+                self.deadline = None
+                return
+            self.index = 0
+        else:
+            self.index += 1
+
+        self.state = TimerState.RUNNING
+        self.deadline = phase_start + self.duration_seconds
+
+    def _continues(self) -> bool:
+        """Whether to roll straight into another set, as with --auto-continue."""
+        if not self.config.auto_continue or not any(minutes for _, minutes, _ in self.phases):
+            return False
+        return not self.config.sets or self.sets_completed < self.config.sets
+
+    def _record(self, session_type: str, minutes: float, partial: bool = False) -> None:
+        if self.statistics_manager:
+            self.statistics_manager.record_session(session_type, minutes, partial=partial)
+
+    def _build_phases(self) -> list[tuple[str, int, int]]:
+        phases = []
+        for cycle in range(1, self.config.number_of_cycles + 1):
+            phases.append(("work", self.config.work_mins, cycle))
+            if cycle < self.config.number_of_cycles:
+                phases.append(("short_break", self.config.short_break_mins, cycle))
+            else:
+                phases.append(("long_break", self.config.long_break_mins, cycle))
+        return phases
@@ -0,0 +1,255 @@
+"""Non-interactive statistics queries for scripts, cron jobs and shell prompts.
+
+Kept free of curses and the timer machinery so ``pomodoro-init --query``
+starts quickly. Each shard's sessions are reduced to per-day summaries (the
+same records retention compaction writes) and cached in an index next to
+the shards, so a repeated query only parses sessions appended since the
+last one.
+"""
+import csv
+import json
+import os
+import sys
+from datetime import date, datetime, timedelta
+from typing import Iterable, Iterator, Optional, TextIO
+
+from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.retention import SESSION_TYPES, add_to_summary, new_summary
+from pomodoro_timer.storage import StorageManager, atomic_write
+from pomodoro_timer.sync import SyncManager
+
+
+PERIOD_COLUMNS = ("period", "work", "short_break", "long_break", "total", "partial", "work_minutes")
+TYPE_COLUMNS = ("type", "sessions", "partial", "minutes")
+
+
+class ShardIndex:
+    """Per-day summaries of each shard, cached on disk and extended as the shard grows."""
+
+    INDEX_DIR = ".index"
+
+    def __init__(self, storage_manager: StorageManager) -> None:
+        self.storage_manager = storage_manager
+        self.index_dir = storage_manager.sessions_dir / self.INDEX_DIR
+
+    def daily_summaries(self, key: str) -> dict[date, dict]:
+        stat = self.storage_manager.get_shard_stat(key)
+        if stat is None:
+            return {}
+
+        cached = self._load(key)
+        if cached and cached["inode"] == stat.st_ino and cached["offset"] == stat.st_size:
+            return cached["days"]
+
+        if cached and cached["inode"] == stat.st_ino and cached["offset"] < stat.st_size:
+            # Appended to since we last looked: only fold in the new lines
+            days, offset = cached["days"], cached["offset"]
+        else:
+            # New, or rewritten by compaction
+            days, offset = {}, 0
+
+        records, offset = self.storage_manager.read_shard_from(key, offset)
+        for record in records:
+            day = datetime.fromisoformat(record["date"]).date()
+            if day not in days:
+                days[day] = new_summary(day)
+            add_to_summary(days[day], record)
+
+        self._save(key, {"inode": stat.st_ino, "offset": offset, "days": days})
+        return days
+
+    def _load(self, key: str) -> Optional[dict]:
+        try:
+            with open(self.index_dir / f"{key}.json", 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            days = {date.fromisoformat(day): summary for day, summary in data["days"].items()}
+            return {"inode": data["inode"], "offset": data["offset"], "days": days}
+        except (OSError, ValueError, KeyError):
+            return None  # Missing or damaged indexes are simply rebuilt
+
+    def _save(self, key: str, index: dict) -> None:
+        data = {
+            "inode": index["inode"],
+            "offset": index["offset"],
+            "days": {day.isoformat(): summary for day, summary in index["days"].items()},
+        }
+        try:
+            atomic_write(self.index_dir / f"{key}.json", json.dumps(data, ensure_ascii=False), durable=False)
+        except OSError:
+            pass  # The index is only a cache
+
+
+class SessionQuery:
+    """Groups sessions between two dates by day, week, month or session type.
+
+    ``extra_sessions`` are counted as if they were in the shards, e.g. other
+    devices' sessions that haven't been imported yet.
+    """
+
+    def __init__(self, storage_manager: StorageManager, extra_sessions: Iterable[dict] = ()) -> None:
+        self.storage_manager = storage_manager
+        self.index = ShardIndex(storage_manager)
+        self.extra: dict[str, list] = {}
+        for session in extra_sessions:
+            key = storage_manager.shard_key(datetime.fromisoformat(session["date"]))
+            self.extra.setdefault(key, []).append(session)
+
+    def rows(self, start_day: Optional[date], end_day: date, group_by: str) -> Iterator[dict]:
+        """Yield result rows oldest first, each as soon as no later shard can change it."""
+        start = datetime.combine(start_day, datetime.min.time()) if start_day else None
+        end = datetime.combine(end_day + timedelta(days=1), datetime.min.time())
+        groups: dict[str, dict] = {}
+
+        keys = set(self.storage_manager.list_shards(start, end - timedelta(microseconds=1)))
+        keys.update(key for key in self.extra if self._overlaps(key, start, end))
+        for key in sorted(keys):
+            for day, summary in self._daily_summaries(key).items():
+                if (start_day and day < start_day) or day > end_day:
+                    continue
+                if group_by == "type":
+                    for session_type in SESSION_TYPES:
+                        self._add_type(groups, session_type, summary)
+                else:
+                    self._add_period(groups, day, group_by, summary)
+
+            if group_by != "type":
+                # Days never span shards, so every period ending by this shard's end is final
+                shard_end = self.storage_manager.shard_bounds(key)[1].date()
+                yield from self._flush(groups, lambda row: row["_end"] <= shard_end)
+
+        yield from self._flush(groups, lambda row: True)
+
+    def _daily_summaries(self, key: str) -> dict[date, dict]:
+        days = self.index.daily_summaries(key)
+        if key not in self.extra:
+            return days
+
+        # Copy before adding, so the cached index isn't changed
+        days = {day: summary for day, summary in days.items()}
+        for session in self.extra[key]:
+            day = datetime.fromisoformat(session["date"]).date()
+            summary = new_summary(day)
+            if day in days:
+                add_to_summary(summary, days[day])
+            add_to_summary(summary, session)
+            days[day] = summary
+        return days
+
+    def _overlaps(self, key: str, start: Optional[datetime], end: datetime) -> bool:
+        shard_start, shard_end = self.storage_manager.shard_bounds(key)
+        return (start is None or shard_end > start) and shard_start < end
+
+    @staticmethod
+    def period(day: date, group_by: str) -> tuple[str, date]:
+        """Label and exclusive end day of the period containing `day`."""
+        if group_by == "week":
+            year, week, weekday = day.isocalendar()
+            return f"{year}-W{week:02d}", day + timedelta(days=8 - weekday)
+        if group_by == "month":
+            next_month = (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+            return f"{day.year:04d}-{day.month:02d}", next_month
+        return day.isoformat(), day + timedelta(days=1)
+
+    def _add_period(self, groups: dict, day: date, group_by: str, summary: dict) -> None:
+        label, period_end = self.period(day, group_by)
+        row = groups.get(label)
+        if row is None:
+            row = {column: 0 for column in PERIOD_COLUMNS}
+            row["period"] = label
+            row["_end"] = period_end
+            groups[label] = row
+
+        for session_type, count in summary["counts"].items():
+            row[session_type] = row.get(session_type, 0) + count
+            row["total"] += count
+        row["partial"] += sum(summary["partials"].values())
+        row["work_minutes"] = round(row["work_minutes"] + summary["minutes"].get("work", 0), 2)
+
+    @staticmethod
+    def _add_type(groups: dict, session_type: str, summary: dict) -> None:
+        count = summary["counts"].get(session_type, 0)
+        if not count:
+            return
+        row = groups.setdefault(session_type, {"type": session_type, "sessions": 0, "partial": 0, "minutes": 0})
+        row["sessions"] += count
+        row["partial"] += summary["partials"].get(session_type, 0)
+        row["minutes"] = round(row["minutes"] + summary["minutes"].get(session_type, 0), 2)
+
+    @staticmethod
+    def _flush(groups: dict, is_final) -> Iterator[dict]:
+        for label in sorted(label for label, row in groups.items() if is_final(row)):
+            row = groups.pop(label)
+            row.pop("_end", None)
+            yield row
+
+
+class RowWriter:
+    """Writes rows to a stream as they arrive, as a JSON array, CSV or an aligned table."""
+
+    def __init__(self, stream: TextIO, output_format: str, columns: tuple) -> None:
+        self.stream = stream
+        self.output_format = output_format
+        self.columns = columns
+        self.count = 0
+        self._csv = csv.writer(stream) if output_format == "csv" else None
+
+    def write(self, row: dict) -> None:
+        if self.count == 0:
+            self._header()
+        self.count += 1
+
+        if self.output_format == "json":
+            separator = "[\n  " if self.count == 1 else ",\n  "
+            self.stream.write(separator + json.dumps(row))
+        elif self._csv:
+            self._csv.writerow([row[column] for column in self.columns])
+        else:
+            self.stream.write(self._table_line([row[column] for column in self.columns]) + "\n")
+
+    def finish(self) -> None:
+        if self.output_format == "json":
+            self.stream.write("\n]\n" if self.count else "[]\n")
+        elif self.count == 0:
+            self._header()
+
+    def _header(self) -> None:
+        if self._csv:
+            self._csv.writerow(self.columns)
+        elif self.output_format == "table":
+            self.stream.write(self._table_line(self.columns) + "\n")
+
+    def _table_line(self, values) -> str:
+        # Fixed widths, so rows can be printed before the whole result is known
+        first, *rest = values
+        return f"{str(first):<12}" + "".join(f"{str(value):>13}" for value in rest)
+
+
+def run_query(config: PomodoroConfig, stream: TextIO = sys.stdout) -> int:
+    try:
+        storage_manager = StorageManager(namespace=config.name)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    # Other devices' new sessions are counted but not imported: queries never write to the store
+    extra_sessions = []
+    sync_manager = SyncManager.from_settings(storage_manager, config.sync_dir, remember=False)
+    if sync_manager:
+        try:
+            extra_sessions = sync_manager.unmerged()
+        except OSError as e:
+            print(f"Warning: Could not read {sync_manager.sync_dir}: {e}", file=sys.stderr)
+
+    end_day = config.query_to or date.today()
+    columns = TYPE_COLUMNS if config.group_by == "type" else PERIOD_COLUMNS
+    writer = RowWriter(stream, config.output_format, columns)
+
+    try:
+        for row in SessionQuery(storage_manager, extra_sessions).rows(config.query_from, end_day, config.group_by):
+            writer.write(row)
+        writer.finish()
+    except BrokenPipeError:
+        # Piped into e.g. `head`, which stopped reading; don't fail again flushing at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
@@ -0,0 +1,125 @@
+import threading
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from pomodoro_timer.storage import StorageManager
+
+
+SUMMARY_TYPE = "summary"
+SESSION_TYPES = ("work", "short_break", "long_break")
+
+
+def is_summary(record: dict) -> bool:
+    return record.get("type") == SUMMARY_TYPE
+
+
+def new_summary(day: date) -> dict:
+    # Session types that didn't occur that day are left out to keep summaries small
+    return {
+        "date": datetime.combine(day, datetime.min.time()).isoformat(),
+        "type": SUMMARY_TYPE,
+        "counts": {},
+        "minutes": {},
+        "partials": {},
+    }
+
+
+def add_to_summary(summary: dict, record: dict) -> None:
+    """Fold a raw session or another summary for the same day into `summary`."""
+    if is_summary(record):
+        for field in ("counts", "minutes", "partials"):
+            for session_type, value in record[field].items():
+                summary[field][session_type] = summary[field].get(session_type, 0) + value
+    else:
+        session_type = record["type"]
+        summary["counts"][session_type] = summary["counts"].get(session_type, 0) + 1
+        summary["minutes"][session_type] = summary["minutes"].get(session_type, 0) + record["duration"]
+        if record.get("partial"):
+            summary["partials"][session_type] = summary["partials"].get(session_type, 0) + 1
+
+    for session_type, minutes in summary["minutes"].items():
+        summary["minutes"][session_type] = round(minutes, 2)
+
+
+class RetentionPolicy:
+    """Replaces raw sessions older than `retention_days` with one summary record per day.
+
+    Compaction works one monthly shard at a time: each shard is rewritten
+    atomically and then marked in the manifest, so an interrupted run simply
+    picks up at the first shard that isn't marked yet.
+    """
+
+    def __init__(self, storage_manager: StorageManager, retention_days: int) -> None:
+        if retention_days < 1:
+            raise ValueError("retention_days must be at least 1")
+        self.storage_manager = storage_manager
+        self.retention_days = retention_days
+        self.error: Optional[str] = None
+
+    def cutoff(self, now: Optional[datetime] = None) -> datetime:
+        """Sessions that started before this midnight get summarized."""
+        today = (now or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+        return today - timedelta(days=self.retention_days)
+
+    def pending_shards(self, cutoff: datetime) -> list[str]:
+        """Shards, oldest first, that may still hold raw sessions from before `cutoff`."""
+        shards = self.storage_manager.load_manifest()["shards"]
+        pending = []
+        for key in sorted(shards):
+            shard_start, shard_end = self.storage_manager.shard_bounds(key)
+            if shard_start >= cutoff:
+                continue
+            target = min(cutoff, shard_end).date().isoformat()
+            if shards[key].get("compacted_before", "") < target:
+                pending.append(key)
+        return pending
+
+    def compact(self, now: Optional[datetime] = None) -> int:
+        """Compact every pending shard and return how many raw sessions were summarized."""
+        cutoff = self.cutoff(now)
+        return sum(self.compact_shard(key, cutoff) for key in self.pending_shards(cutoff))
+
+    def compact_shard(self, key: str, cutoff: datetime) -> int:
+        storage = self.storage_manager
+        with storage.locked():
+            records = storage.read_shard(key)
+            summaries: dict[date, dict] = {}
+            kept = []
+            compacted = 0
+
+            for record in records:
+                started = datetime.fromisoformat(record["date"])
+                if started >= cutoff:
+                    kept.append(record)
+                    continue
+
+                day = started.date()
+                if day not in summaries:
+                    summaries[day] = new_summary(day)
+                add_to_summary(summaries[day], record)
+                if not is_summary(record):
+                    compacted += 1
+
+            if compacted:
+                storage.rewrite_shard(key, [summaries[day] for day in sorted(summaries)] + kept)
+
+            manifest = storage.load_manifest()
+            entry = manifest["shards"].setdefault(key, {"sessions": 0})
+            entry["sessions"] = len(summaries) + len(kept) if compacted else len(records)
+            entry["compacted_before"] = min(cutoff, storage.shard_bounds(key)[1]).date().isoformat()
+            storage.save_manifest(manifest)
+
+        return compacted
+
+    def start_background(self) -> threading.Thread:
+        """Compact in a daemon thread so startup isn't held up by old history."""
+        thread = threading.Thread(target=self._compact_quietly, name="pomodoro-retention", daemon=True)
+        thread.start()
+        return thread
+
+    def _compact_quietly(self) -> None:
+        # Curses may own the terminal, so leave the error for the caller to report afterwards
+        try:
+            self.compact()
+        except (OSError, ValueError, KeyError) as e:
+            self.error = f"Session compaction stopped early: {e}"
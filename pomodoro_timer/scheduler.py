@@ -0,0 +1,123 @@
+import heapq
+from itertools import count
+from typing import Optional
+
+from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.pomodoro_cycle import PomodoroCycle
+from pomodoro_timer.statistics import StatisticsManager
+from pomodoro_timer.storage import StorageManager
+from pomodoro_timer.sync import MERGE_INTERVAL, SyncManager, start_sync
+
+
+class TimerScheduler:
+    """Runs many named Pomodoro cycles in one process off a single heap of deadlines.
+
+    Pausing, skipping or removing a timer leaves its old heap entry in place;
+    entries are checked against the timer's current deadline when they reach
+    the top and dropped if stale, so every operation stays O(log n).
+    """
+
+    def __init__(self, config: PomodoroConfig):
+        self.config = config
+        self.timers: dict[str, PomodoroCycle] = {}
+        self.sync_managers: dict[str, SyncManager] = {}
+        # One shared merge time, so waking up for a deadline doesn't visit every synced timer
+        self.next_merge = 0.0
+        self._heap: list[tuple[float, int, str]] = []
+        self._sequence = count()
+
+    def add(self, name: str, now: float, config: Optional[PomodoroConfig] = None,
+            statistics_manager: Optional[StatisticsManager] = None,
+            sync_manager: Optional[SyncManager] = None) -> PomodoroCycle:
+        """Start a named timer; by default its sessions go to the stats namespace of the same name.
+
+        A ``statistics_manager`` passed in is expected to be publishing to
+        ``sync_manager`` already; otherwise the new namespace is synced here
+        if syncing is configured.
+        """
+        if name in self.timers:
+            raise ValueError(f"A timer named {name!r} already exists")
+
+        if statistics_manager is None:
+            storage_manager = StorageManager(namespace=name)
+            statistics_manager = StatisticsManager(storage_manager, retention_days=self.config.retention_days)
+            sync_manager = start_sync(statistics_manager)
+        if sync_manager:
+            if not self.sync_managers:
+                self.next_merge = now + MERGE_INTERVAL  # Starting it just merged
+            self.sync_managers[name] = sync_manager
+
+        cycle = PomodoroCycle(config or self.config, statistics_manager)
+        cycle.start(now)
+        self.timers[name] = cycle
+        self._schedule(name)
+        return cycle
+
+    def remove(self, name: str, now: float) -> None:
+        self.get(name).stop(now)
+        del self.timers[name]
+        self.sync_managers.pop(name, None)
+
+    def get(self, name: str) -> PomodoroCycle:
+        try:
+            return self.timers[name]
+        except KeyError:
+            raise KeyError(f"No timer named {name!r}") from None
+
+    def pause(self, name: str, now: float) -> bool:
+        return self.get(name).pause(now)
+
+    def resume(self, name: str, now: float) -> bool:
+        resumed = self.get(name).resume(now)
+        if resumed:
+            self._schedule(name)
+        return resumed
+
+    def skip(self, name: str, now: float) -> bool:
+        skipped = self.get(name).skip(now)
+        if skipped:
+            self._schedule(name)
+        return skipped
+
+    def restart(self, name: str, now: float) -> None:
+        self.get(name).start(now)
+        self._schedule(name)
+
+    def next_deadline(self) -> Optional[float]:
+        """The earliest live deadline across all timers, discarding stale heap entries."""
+        while self._heap:
+            deadline, _, name = self._heap[0]
+            if self._is_current(deadline, name):
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    def merge_synced(self, now: float) -> int:
+        """Import other devices' sessions for every synced timer, once ``next_merge`` has come."""
+        if not self.sync_managers or now < self.next_merge:
+            return 0
+        self.next_merge = now + MERGE_INTERVAL
+        return sum(sync_manager.catch_up() for sync_manager in self.sync_managers.values())
+
+    def run_due(self, now: float) -> list[tuple[str, int]]:
+        """Advance every timer whose deadline has passed; returns (name, phases finished) pairs."""
+        advanced = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, _, name = heapq.heappop(self._heap)
+            if not self._is_current(deadline, name):
+                continue
+
+            finished = self.timers[name].advance(now)
+            advanced.append((name, finished))
+            self._schedule(name)
+
+        return advanced
+
+    def _schedule(self, name: str) -> None:
+        deadline = self.timers[name].next_deadline
+        if deadline is not None:
+            heapq.heappush(self._heap, (deadline, next(self._sequence), name))
+
+    def _is_current(self, deadline: float, name: str) -> bool:
+        cycle = self.timers.get(name)
+        return cycle is not None and cycle.next_deadline == deadline
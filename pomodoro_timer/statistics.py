@@ -1,35 +1,59 @@
+import time
 from datetime import datetime, timedelta
-from collections import Counter
+from typing import Callable, Optional
+from pomodoro_timer.daily_stats import DailyStatsCache
+from pomodoro_timer.retention import RetentionPolicy, is_summary
 from pomodoro_timer.storage import StorageManager
 
 
 class StatisticsManager:
     """Manages users statistics for the Pomodoro Timer application."""
 
-    def __init__(self, storage_manager: StorageManager) -> None:
+    def __init__(self, storage_manager: StorageManager, retention_days: int = 0) -> None:
+        """With ``retention_days`` set, older sessions are kept only as per-day summaries."""
         self.storage_manager = storage_manager
-        self.data = storage_manager.load_json('stats.json')
-
-        if not self.data or 'sessions' not in self.data:
-            self.data = {"sessions": []}
-
-    def record_session(self, session_type: str, duration: float) -> None:
-        """Record a completed or partial session."""
+        self.daily_stats = DailyStatsCache(storage_manager)
+        self.retention: Optional[RetentionPolicy] = (
+            RetentionPolicy(storage_manager, retention_days) if retention_days else None
+        )
+        self.listeners: list[Callable[[dict, float], None]] = []
+
+    def add_listener(self, listener: Callable[[dict, float], None]) -> None:
+        """Call ``listener(session, seconds_to_save)`` after each session is recorded."""
+        self.listeners.append(listener)
+
+    def start_compaction(self) -> None:
+        """Summarize sessions past the retention cutoff in the background, if a policy is set."""
+        if self.retention:
+            self.retention.start_background()
+
+    def compaction_error(self) -> Optional[str]:
+        """Why background compaction stopped early, if it did; it picks up again next start."""
+        return self.retention.error if self.retention else None
+
+    def record_session(self, session_type: str, duration: float, partial: bool = False) -> None:
+        """Record a completed session, or with ``partial`` one that was skipped or quit part way."""
         session = {
             "date": datetime.now().isoformat(),
             "type": session_type,
             "duration": round(duration, 2),
-            "partial": duration % 1 != 0
+            "partial": partial
         }
-        self.data["sessions"].append(session)
-        self.storage_manager.save_json('stats.json', self.data)
+        started = time.perf_counter()
+        self.storage_manager.append_session(session)
+        elapsed = time.perf_counter() - started
+
+        for listener in self.listeners:
+            listener(session, elapsed)
 
     def get_sessions(self, start_date: datetime = None, end_date: datetime = None) -> list:
-        if start_date is None and end_date is None:
-            return self.data["sessions"]
+        """Raw sessions in the range; days past the retention cutoff only count towards totals."""
+        sessions = self.storage_manager.load_sessions(start_date, end_date)
 
         filtered_sessions = []
-        for session in self.data["sessions"]:
+        for session in sessions:
+            if is_summary(session):
+                continue
             session_date = datetime.fromisoformat(session["date"])
 
             if start_date and session_date < start_date:
@@ -42,19 +66,34 @@ class StatisticsManager:
         return filtered_sessions
 
     def get_totals(self, period: str = 'all_time') -> dict:
-        start_date = self._get_period_start(period) if period != 'all_time' else None
-        sessions = self.get_sessions(start_date=start_date)
-
-        session_types = [session["type"] for session in sessions]
-        counts = Counter(session_types)
+        totals = self._get_period_totals(period)
 
         return {
-            "work": counts.get("work", 0),
-            "short_break": counts.get("short_break", 0),
-            "long_break": counts.get("long_break", 0),
-            "total": len(sessions)
+            "work": totals["work"],
+            "short_break": totals["short_break"],
+            "long_break": totals["long_break"],
+            "total": totals["total"]
         }
 
+    def get_work_minutes(self, period: str = 'all_time') -> float:
+        return self._get_period_totals(period)["work_minutes"]
+
+    def get_daily_work_minutes(self, start_date: datetime, end_date: datetime) -> dict:
+        """Work minutes per day between two dates, reading only the shards that cover them."""
+        self.daily_stats.ensure_range_loaded(start_date, end_date)
+        self.daily_stats.refresh()
+        return self.daily_stats.work_minutes_by_day(start_date.date(), end_date.date())
+
+    def refresh(self) -> int:
+        """Pick up sessions recorded since the last query, e.g. by a timer in another terminal."""
+        return self.daily_stats.refresh()
+
+    def _get_period_totals(self, period: str) -> dict:
+        start_date = self._get_period_start(period) if period != 'all_time' else None
+        self.daily_stats.ensure_loaded(start_date)
+        self.daily_stats.refresh()
+        return self.daily_stats.totals(start_date)
+
     def _get_period_start(self, period: str) -> datetime:
         now = datetime.now()
 
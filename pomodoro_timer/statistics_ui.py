@@ -1,28 +1,52 @@
 import curses
+from datetime import datetime, timedelta
+from typing import Optional
 
 from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.file_watcher import FileWatcher
 from pomodoro_timer.statistics import StatisticsManager
+from pomodoro_timer.sync import SyncManager
 from pomodoro_timer.theme_manager import ThemeManager
 
 
 class StatisticsUI:
     """Displays Pomodoro session statistics in a curses interface."""
 
-    def __init__(self, stats_manager: StatisticsManager, theme_manager: ThemeManager, config: PomodoroConfig):
+    LIVE_REFRESH_MS = 250
+    HEATMAP_LEVELS = "·░▒▓█"
+    HEATMAP_CELL_WIDTH = 2
+    HEATMAP_LABEL_WIDTH = 4
+
+    def __init__(self, stats_manager: StatisticsManager, theme_manager: ThemeManager, config: PomodoroConfig,
+                 sync_manager: Optional[SyncManager] = None):
         self.stats_manager = stats_manager
+        self.sync_manager = sync_manager
         self.theme_manager = theme_manager
         self.config = config
         self.current_period = 'today'
+        self.view = 'totals'
+        self.heatmap_end = self._start_of_week(datetime.now())
+        self.watcher = None
+        self._rendered_lines: dict[int, tuple[str, int]] = {}
 
     def run(self, stdscr):
         curses.curs_set(0)
-        stdscr.nodelay(False)
         self._init_colors()
 
-        while True:
-            self._display(stdscr)
-            if not self._handle_input(stdscr):
-                break
+        if self.config.live_stats:
+            self.watcher = FileWatcher(self.stats_manager.storage_manager.sessions_dir)
+            stdscr.timeout(self.LIVE_REFRESH_MS)
+        else:
+            stdscr.nodelay(False)
+
+        try:
+            while True:
+                self._display(stdscr)
+                if not self._handle_input(stdscr):
+                    break
+        finally:
+            if self.watcher:
+                self.watcher.close()
 
     def _init_colors(self):
         curses.start_color()
@@ -31,7 +55,12 @@ class StatisticsUI:
         curses.init_pair(1, color_code, -1)
 
     def _display(self, stdscr):
-        stdscr.clear()
+        if self.view == 'heatmap':
+            self._draw_lines(stdscr, self._heatmap_lines(stdscr))
+        else:
+            self._draw_lines(stdscr, self._totals_lines(stdscr))
+
+    def _totals_lines(self, stdscr) -> dict:
         height, _ = stdscr.getmaxyx()
 
         totals = self.stats_manager.get_totals(self.current_period)
@@ -40,41 +69,132 @@ class StatisticsUI:
         total_work_minutes = self._calculate_work_minutes()
 
         current_y = height // 3
+        lines = {}
 
-        self._center_text(stdscr, current_y, f"📊 POMODORO STATISTICS - {period_title}", 1)
+        title = f"📊 POMODORO STATISTICS - {period_title}"
+        if self.watcher:
+            title += " (live)"
+        lines[current_y] = (title, 1)
         current_y += 1
 
-        motivation = self._get_motivation_message(total_work_minutes, period_title)
-        self._center_text(stdscr, current_y, motivation)
+        lines[current_y] = (self._get_motivation_message(total_work_minutes, period_title), 0)
         current_y += 3
 
-        self._center_text(stdscr, current_y, f"Work Sessions: {totals['work']}", 1)
+        lines[current_y] = (f"Work Sessions: {totals['work']}", 1)
+        current_y += 1
+        lines[current_y] = (f"Short Breaks: {totals['short_break']}", 1)
         current_y += 1
-        self._center_text(stdscr, current_y, f"Short Breaks: {totals['short_break']}", 1)
+        lines[current_y] = (f"Long Breaks: {totals['long_break']}", 1)
+
+        lines[height - 3] = ("[1] Today  [2] Week  [3] Month  [4] All Time  [5] Calendar  [Q] Quit", 0)
+
+        return lines
+
+    def _heatmap_lines(self, stdscr) -> dict:
+        """Build a calendar heatmap for just the weeks that fit on screen, ending at heatmap_end."""
+        height, width = stdscr.getmaxyx()
+        visible_weeks = max(1, (width - self.HEATMAP_LABEL_WIDTH - 2) // self.HEATMAP_CELL_WIDTH)
+        first_monday = self.heatmap_end - timedelta(weeks=visible_weeks - 1)
+        last_day = self.heatmap_end + timedelta(days=6)
+
+        minutes_by_day = self.stats_manager.get_daily_work_minutes(first_monday, last_day)
+        today = datetime.now().date()
+
+        month_row = [" "] * (visible_weeks * self.HEATMAP_CELL_WIDTH)
+        day_rows = [[] for _ in range(7)]
+        for week in range(visible_weeks):
+            monday = (first_monday + timedelta(weeks=week)).date()
+            for weekday in range(7):
+                day = monday + timedelta(days=weekday)
+                if day > today:
+                    cell = " "
+                else:
+                    cell = self.HEATMAP_LEVELS[self._heatmap_level(minutes_by_day[day])]
+                day_rows[weekday].append(cell.ljust(self.HEATMAP_CELL_WIDTH))
+
+                if day.day == 1:
+                    column = week * self.HEATMAP_CELL_WIDTH
+                    # A month starting in the last visible week gets only the columns left
+                    label = day.strftime("%b")[:len(month_row) - column]
+                    month_row[column:column + len(label)] = label
+
+        current_y = max(0, height // 2 - 7)
+        lines = {}
+
+        range_title = f"{first_monday:%b %d, %Y} - {last_day:%b %d, %Y}"
+        lines[current_y] = (f"📅 FOCUS CALENDAR - {range_title}", 1)
+        current_y += 1
+
+        visible_minutes = round(sum(minutes_by_day.values()), 2)
+        lines[current_y] = (self._get_motivation_message(visible_minutes, "in this range"), 0)
+        current_y += 2
+
+        label_padding = " " * self.HEATMAP_LABEL_WIDTH
+        lines[current_y] = (label_padding + "".join(month_row), 1)
         current_y += 1
-        self._center_text(stdscr, current_y, f"Long Breaks: {totals['long_break']}", 1)
 
-        self._center_text(stdscr, height - 3, "[1] Today  [2] Week  [3] Month  [4] All Time  [Q] Quit")
+        weekday_labels = ["Mon", "", "Wed", "", "Fri", "", "Sun"]
+        for weekday, cells in enumerate(day_rows):
+            label = weekday_labels[weekday].ljust(self.HEATMAP_LABEL_WIDTH)
+            lines[current_y] = (label + "".join(cells), 1)
+            current_y += 1
 
+        current_y += 1
+        lines[current_y] = ("Less " + " ".join(self.HEATMAP_LEVELS) + " More", 0)
+
+        lines[height - 3] = ("[←/→] Month  [PgUp/PgDn] Year  [T] This Week  [1-4] Totals  [Q] Quit", 0)
+
+        return lines
+
+    def _heatmap_level(self, minutes: float) -> int:
+        """Map a day's work minutes to a shade, measured in Pomodoros of the configured length."""
+        if minutes <= 0:
+            return 0
+        pomodoros = minutes / max(1, self.config.work_mins)
+        if pomodoros <= 1:
+            return 1
+        if pomodoros <= 3:
+            return 2
+        if pomodoros <= 6:
+            return 3
+        return 4
+
+    def _scroll_heatmap(self, weeks: int):
+        current_week = self._start_of_week(datetime.now())
+        self.heatmap_end = min(current_week, self.heatmap_end + timedelta(weeks=weeks))
+
+    def _start_of_week(self, moment: datetime) -> datetime:
+        monday = moment - timedelta(days=moment.weekday())
+        return monday.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def _draw_lines(self, stdscr, lines: dict):
+        """Redraw only the rows whose text changed since the previous frame."""
+        if set(lines) != set(self._rendered_lines):
+            stdscr.clear()
+            self._rendered_lines = {}
+
+        height, _ = stdscr.getmaxyx()
+        for y, (text, color_pair) in lines.items():
+            if self._rendered_lines.get(y) == (text, color_pair) or not 0 <= y < height:
+                continue
+            stdscr.move(y, 0)
+            stdscr.clrtoeol()
+            self._center_text(stdscr, y, text, color_pair)
+
+        self._rendered_lines = lines
         stdscr.refresh()
 
     def _center_text(self, stdscr, y, text, color_pair=0):
         _, width = stdscr.getmaxyx()
-        x = (width - len(text)) // 2
-        stdscr.addstr(y, x, text, curses.color_pair(color_pair))
+        # Lines wider than the terminal start at the left edge and are cut off
+        x = max(0, (width - len(text)) // 2)
+        try:
+            stdscr.addstr(y, x, text[:width - x], curses.color_pair(color_pair))
+        except curses.error:
+            pass  # e.g. a wide emoji pushing the last character past the edge
 
     def _calculate_work_minutes(self):
-        sessions = self.stats_manager.get_sessions(
-            start_date=self.stats_manager._get_period_start(self.current_period)
-            if self.current_period != 'all_time' else None
-        )
-
-        total_minutes = sum(
-            session['duration']
-            for session in sessions
-            if session['type'] == 'work'
-        )
-        return total_minutes
+        return self.stats_manager.get_work_minutes(self.current_period)
 
     def _get_motivation_message(self, minutes, period):
         if minutes == 0:
@@ -82,8 +202,20 @@ class StatisticsUI:
 
         return f"You focused for {minutes} minutes! Keep this momentum going!"
 
+    def _wait_for_key(self, stdscr):
+        """Block until a key is pressed, or in live mode until the session store changes."""
+        while True:
+            key = stdscr.getch()
+            if key != -1 or not self.watcher:
+                return key
+            if self.sync_manager:
+                # Imported sessions land in the local shards, which the watcher then reports
+                self.sync_manager.maybe_merge()
+            if self.watcher.has_changed() and self.stats_manager.refresh():
+                return -1
+
     def _handle_input(self, stdscr):
-        key = stdscr.getch()
+        key = self._wait_for_key(stdscr)
 
         if key == ord('1'):
             self.current_period = 'today'
@@ -93,7 +225,30 @@ class StatisticsUI:
             self.current_period = 'month'
         elif key == ord('4'):
             self.current_period = 'all_time'
+        elif key == ord('5'):
+            self.view = 'heatmap'
+            return True
+        elif self.view == 'heatmap' and key == curses.KEY_LEFT:
+            self._scroll_heatmap(-4)
+            return True
+        elif self.view == 'heatmap' and key == curses.KEY_RIGHT:
+            self._scroll_heatmap(4)
+            return True
+        elif self.view == 'heatmap' and key == curses.KEY_PPAGE:
+            self._scroll_heatmap(-52)
+            return True
+        elif self.view == 'heatmap' and key == curses.KEY_NPAGE:
+            self._scroll_heatmap(52)
+            return True
+        elif self.view == 'heatmap' and key in [ord('t'), ord('T')]:
+            self.heatmap_end = self._start_of_week(datetime.now())
+            return True
+        elif key == curses.KEY_RESIZE:
+            self._rendered_lines = {}
         elif key in [ord('q'), ord('Q'), 27]:
             return False
 
-        return True
\ No newline at end of file
+        if key in [ord('1'), ord('2'), ord('3'), ord('4')]:
+            self.view = 'totals'
+
+        return True
@@ -0,0 +1,124 @@
+"""Tiny memory-mapped status record shared between the daemon and status-bar clients.
+
+This module is imported on the ``pomodoro-init --status`` fast path, so it
+must only depend on the standard library modules that are already loaded
+when Python starts (plus struct/mmap).
+"""
+import os
+import struct
+import time
+
+STATUS_FLAG = "--status"
+STATUS_PATH = os.path.join(os.path.expanduser("~"), ".pomodoro", "status")
+
+# magic, version, state, phase, seq, cycle, total cycles, pid, deadline, remaining, duration
+STATUS_FORMAT = "<4sBBBxIHHIddd"
+STATUS_SIZE = struct.calcsize(STATUS_FORMAT)
+STATUS_MAGIC = b"POMO"
+STATUS_VERSION = 1
+
+STATES = ("idle", "running", "paused", "completed")
+PHASES = ("", "work", "short_break", "long_break")
+PHASE_ICONS = {"work": "🍅", "short_break": "☕", "long_break": "🎉"}
+
+
+class StatusWriter:
+    """Publishes the daemon's current phase into a memory-mapped file using a seqlock."""
+
+    def __init__(self, path: str = STATUS_PATH):
+        import mmap
+
+        self.path = path
+        self.seq = 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            os.ftruncate(fd, STATUS_SIZE)
+            self._map = mmap.mmap(fd, STATUS_SIZE)
+        finally:
+            os.close(fd)
+
+    def publish(self, state: str, phase: str = "", cycle: int = 0, total_cycles: int = 0,
+                deadline: float = 0.0, remaining: float = 0.0, duration: float = 0.0) -> None:
+        # An odd sequence number tells readers a write is in progress
+        self.seq += 1
+        struct.pack_into("<I", self._map, 8, self.seq)
+        record = struct.pack(
+            STATUS_FORMAT, STATUS_MAGIC, STATUS_VERSION, STATES.index(state), PHASES.index(phase),
+            self.seq, cycle, total_cycles, os.getpid(), deadline, remaining, duration
+        )
+        self._map[:8] = record[:8]
+        self._map[12:] = record[12:]
+        self.seq += 1
+        struct.pack_into("<I", self._map, 8, self.seq)
+
+    def close(self) -> None:
+        self.publish("idle")
+        self._map.close()
+
+
+def read_status(path: str = STATUS_PATH) -> dict | None:
+    """Read a consistent snapshot of the status record, or None if no daemon is running."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+
+    try:
+        for _ in range(100):
+            data = os.pread(fd, STATUS_SIZE, 0)
+            if len(data) < STATUS_SIZE:
+                return None
+            fields = struct.unpack(STATUS_FORMAT, data)
+            if fields[4] % 2 == 0 and os.pread(fd, 4, 8) == data[8:12]:
+                break
+        else:
+            return None
+    finally:
+        os.close(fd)
+
+    magic, version, state, phase, _, cycle, total_cycles, pid, deadline, remaining, duration = fields
+    if magic != STATUS_MAGIC or version != STATUS_VERSION or STATES[state] == "idle":
+        return None
+    if not _process_alive(pid):
+        return None
+
+    if STATES[state] == "running":
+        remaining = max(0.0, deadline - time.time())
+
+    return {
+        "state": STATES[state],
+        "phase": PHASES[phase],
+        "cycle": cycle,
+        "total_cycles": total_cycles,
+        "remaining": remaining,
+        "duration": duration,
+    }
+
+
+def format_status(status: dict) -> str:
+    """One short line for tmux/polybar, e.g. '🍅 12:34 (2/4)'."""
+    if status["state"] == "completed":
+        return "✨ done"
+
+    mins, secs = divmod(int(status["remaining"] + 0.999), 60)
+    icon = "⏸" if status["state"] == "paused" else PHASE_ICONS.get(status["phase"], "")
+    return f"{icon} {mins:02d}:{secs:02d} ({status['cycle']}/{status['total_cycles']})"
+
+
+def print_status(path: str = STATUS_PATH) -> int:
+    status = read_status(path)
+    if status is None:
+        return 1
+    os.write(1, (format_status(status) + "\n").encode("utf-8"))
+    return 0
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
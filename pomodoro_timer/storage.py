@@ -1,13 +1,84 @@
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
+from typing import Iterator, Optional
+import fcntl
 import json
+import os
+import re
 import sys
 
+
+def read_jsonl_from(path: Path, offset: int = 0) -> tuple[list, int]:
+    """Read the complete JSON lines in ``path`` after byte ``offset``, and the offset to resume from."""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return [], offset
+
+    end = data.rfind(b"\n") + 1
+    records = []
+    for line in data[:end].splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError as e:
+            print(f"Warning: Skipping corrupted line in {path}: {e}", file=sys.stderr)
+    return records, offset + end
+
+
+def atomic_write(path: Path, text: str, durable: bool = True) -> None:
+    """Replace ``path`` with ``text`` in one step, so readers never see half a file.
+
+    The text goes to a temporary file next to ``path`` that is then renamed
+    over it; on failure the temporary file is removed and the error re-raised.
+    ``durable`` also syncs the data to disk before the rename, for files that
+    must survive a crash rather than only a concurrent reader.
+    """
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            temp_path.unlink(missing_ok=True)
+        except OSError:
+            pass  # e.g. the parent is not a directory, so there is nothing to clean up
+        raise
+
+
 class StorageManager:
     """Handles loading and saving of user settings and session data."""
 
-    def __init__(self) -> None:
+    SESSIONS_DIR = "sessions"
+    NAMESPACES_DIR = "namespaces"
+    MANIFEST_FILE = "manifest.json"
+    LOCK_FILE = ".lock"
+    LEGACY_STATS_FILE = "stats.json"
+    # Must not start with a dot, so "." and ".." can't escape into the main store
+    NAMESPACE_PATTERN = re.compile(r"[A-Za-z0-9_-][A-Za-z0-9_.-]*")
+
+    def __init__(self, namespace: Optional[str] = None) -> None:
+        """Use ``namespace`` to keep a separate session history, e.g. one per person or room."""
+        if namespace is not None and not self.NAMESPACE_PATTERN.fullmatch(namespace):
+            raise ValueError(
+                f"Invalid namespace {namespace!r}: use letters, digits, '.', '_' or '-', not starting with '.'"
+            )
+
         self.base_dir: Path = Path.home() / ".pomodoro"
+        self.namespace = namespace
+        self.sessions_subdir = self.SESSIONS_DIR if namespace is None else f"{self.NAMESPACES_DIR}/{namespace}"
         self.ensure_data_dir()
+        if namespace is None:
+            self._migrate_legacy_stats()
 
     def ensure_data_dir(self) -> Path:
         path = Path(self.base_dir)
@@ -41,4 +112,188 @@ class StorageManager:
                 json.dump(data, f, indent=2, ensure_ascii=False)
         except IOError as e:
             print(f"Error writing to {path}: {e}", file=sys.stderr)
-            raise
\ No newline at end of file
+            raise
+
+    # Session shards: one JSON-lines file per calendar month, plus a small
+    # manifest listing which shards exist and how many sessions each holds.
+
+    @property
+    def sessions_dir(self) -> Path:
+        return self.base_dir / self.sessions_subdir
+
+    @staticmethod
+    def shard_key(date: datetime) -> str:
+        return f"{date.year:04d}-{date.month:02d}"
+
+    @staticmethod
+    def shard_bounds(key: str) -> tuple[datetime, datetime]:
+        """Return the [start, end) datetimes covered by a shard key."""
+        year, month = (int(part) for part in key.split('-'))
+        start = datetime(year, month, 1)
+        end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+        return start, end
+
+    def get_shard_path(self, key: str) -> Path:
+        return self.sessions_dir / f"{key}.jsonl"
+
+    def load_manifest(self) -> dict:
+        # Re-read on every call: another process (e.g. a timer in a second
+        # terminal) may have added a shard since we last looked.
+        manifest = self.load_json(f"{self.sessions_subdir}/{self.MANIFEST_FILE}")
+        if 'shards' not in manifest:
+            manifest = self._rebuild_manifest()
+        return manifest
+
+    def save_manifest(self, manifest: dict) -> None:
+        """Replace the manifest in one step, so a crash mid-write can't lose the shard list."""
+        path = self.sessions_dir / self.MANIFEST_FILE
+        try:
+            atomic_write(path, json.dumps(manifest, indent=2, ensure_ascii=False))
+        except IOError as e:
+            print(f"Error writing to {path}: {e}", file=sys.stderr)
+            raise
+
+    def _rebuild_manifest(self) -> dict:
+        """Recreate a missing or unreadable manifest from the shard files on disk."""
+        manifest = {"version": 1, "shards": {}}
+        for path in sorted(self.sessions_dir.glob("*.jsonl")):
+            try:
+                self.shard_bounds(path.stem)
+            except ValueError:
+                continue  # Not a shard, e.g. a stray temp file
+            with open(path, 'rb') as f:
+                manifest["shards"][path.stem] = {"sessions": sum(1 for line in f if line.strip())}
+
+        if manifest["shards"]:
+            # Shards are only written once the legacy stats.json has been migrated
+            manifest["migrated"] = True
+        return manifest
+
+    def list_shards(self, start_date: datetime = None, end_date: datetime = None) -> list[str]:
+        """Return shard keys, oldest first, that overlap the given date range."""
+        keys = []
+        for key in sorted(self.load_manifest()["shards"]):
+            shard_start, shard_end = self.shard_bounds(key)
+            if start_date and shard_end <= start_date:
+                continue
+            if end_date and shard_start > end_date:
+                continue
+            keys.append(key)
+        return keys
+
+    def append_session(self, session: dict) -> None:
+        """Append a session to the shard for its month, touching no other shard."""
+        self.append_sessions([session])
+
+    def append_sessions(self, sessions: list) -> None:
+        with self.locked():
+            self._append_sessions_locked(sessions)
+
+    def _append_sessions_locked(self, sessions: list) -> None:
+        by_shard: dict[str, list] = {}
+        for session in sessions:
+            key = self.shard_key(datetime.fromisoformat(session["date"]))
+            by_shard.setdefault(key, []).append(session)
+
+        manifest = self.load_manifest()
+        shards = manifest["shards"]
+
+        for key, shard_sessions in by_shard.items():
+            path = self.get_shard_path(key)
+            try:
+                with open(path, 'a', encoding='utf-8') as f:
+                    for session in shard_sessions:
+                        f.write(json.dumps(session, ensure_ascii=False) + "\n")
+            except IOError as e:
+                print(f"Error writing to {path}: {e}", file=sys.stderr)
+                raise
+
+            entry = shards.setdefault(key, {"sessions": 0})
+            entry["sessions"] += len(shard_sessions)
+            # New raw sessions may fall before the retention cutoff again
+            entry.pop("compacted_before", None)
+
+        self.save_manifest(manifest)
+
+    def rewrite_shard(self, key: str, records: list) -> None:
+        """Atomically replace a shard's contents; call with ``locked()`` held.
+
+        Readers see either the old file or the new one, never a mix, and an
+        interrupted rewrite leaves the old shard untouched.
+        """
+        path = self.get_shard_path(key)
+        text = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        try:
+            atomic_write(path, text)
+        except IOError as e:
+            print(f"Error writing to {path}: {e}", file=sys.stderr)
+            raise
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold an exclusive lock on this session store across processes and threads."""
+        self.sessions_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.sessions_dir / self.LOCK_FILE, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def read_shard(self, key: str) -> list:
+        path = self.get_shard_path(key)
+        if not path.exists():
+            return []
+
+        sessions = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    sessions.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    print(f"Warning: Skipping corrupted line {line_number} in {path}: {e}", file=sys.stderr)
+        return sessions
+
+    def read_shard_from(self, key: str, offset: int = 0) -> tuple[list, int]:
+        """Read complete session lines appended to a shard after ``offset``.
+
+        Returns the sessions and the offset to resume from next time. A
+        trailing line that is still being written is left for the next call.
+        """
+        return read_jsonl_from(self.get_shard_path(key), offset)
+
+    def get_shard_stat(self, key: str) -> Optional[os.stat_result]:
+        try:
+            return self.get_shard_path(key).stat()
+        except FileNotFoundError:
+            return None
+
+    def load_sessions(self, start_date: datetime = None, end_date: datetime = None) -> list:
+        """Load sessions from only the shards overlapping the given range."""
+        sessions = []
+        for key in self.list_shards(start_date, end_date):
+            sessions.extend(self.read_shard(key))
+        return sessions
+
+    def _migrate_legacy_stats(self) -> None:
+        """One-shot migration from the single stats.json file to monthly shards."""
+        legacy_path = self.get_file_path(self.LEGACY_STATS_FILE)
+        if not legacy_path.exists():
+            return
+
+        # Two timers started at once must not both import the legacy sessions
+        with self.locked():
+            if not self.load_manifest().get("migrated"):
+                legacy = self.load_json(self.LEGACY_STATS_FILE)
+                sessions = legacy.get("sessions", []) if legacy else []
+                if sessions:
+                    self._append_sessions_locked(sorted(sessions, key=lambda session: session["date"]))
+
+                manifest = self.load_manifest()
+                manifest["migrated"] = True
+                self.save_manifest(manifest)
+
+            if legacy_path.exists():
+                legacy_path.rename(legacy_path.with_suffix('.json.migrated'))
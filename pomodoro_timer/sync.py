@@ -0,0 +1,359 @@
+"""Share sessions between devices through a plain shared directory.
+
+Every device appends the sessions it records to its own ``<device>.jsonl``
+log in the shared directory, numbering them with a sequence that restarts
+under a new random epoch whenever the log isn't the one this device last
+wrote (e.g. it was restored from an older backup), so numbers other devices
+have already seen are never handed out again. Merging reads each other
+device's log only from the byte offset reached last time and imports
+sessions whose (device, epoch, seq) is newer than anything seen from that
+log. Copies of a log (e.g. a sync tool's "conflicted copy") offer the same
+sessions again; of all candidates for one (device, epoch, seq) the one in
+the device's own log wins, then the smallest by its JSON text, so the
+outcome doesn't depend on file names or on what was read first.
+"""
+import errno
+import fcntl
+import json
+import os
+import re
+import socket
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from pomodoro_timer.statistics import StatisticsManager
+from pomodoro_timer.storage import StorageManager, read_jsonl_from
+
+
+SETTINGS_FILE = "sync.json"
+STATE_FILE = "sync_state.json"
+PUBLISHED_FILE = "sync_published.json"
+UNPUBLISHED_FILE = "sync_unpublished.jsonl"
+DEVICE_ID_FILE = "device_id"
+DISABLE = "off"
+MERGE_INTERVAL = 60.0
+# Remembered from just before each log's read offset, to notice logs rewritten rather than appended to
+TAIL_BYTES = 64
+
+
+def load_device_id(storage_manager: StorageManager) -> str:
+    """This machine's sync id, created on first use as ``<hostname>-<random>``."""
+    path = storage_manager.get_file_path(DEVICE_ID_FILE)
+    try:
+        device_id = path.read_text(encoding='utf-8').strip()
+        if device_id:
+            return device_id
+    except FileNotFoundError:
+        pass
+
+    hostname = re.sub(r"[^A-Za-z0-9_.-]", "-", socket.gethostname().split('.')[0]) or "device"
+    device_id = f"{hostname}-{uuid.uuid4().hex[:8]}"
+    storage_manager.ensure_data_dir()
+    path.write_text(device_id + "\n", encoding='utf-8')
+    return device_id
+
+
+def record_key(record: dict) -> Optional[tuple[str, str, int]]:
+    """The (device, epoch, seq) identifying a published session, or None for anything else."""
+    device, seq = record.get("device"), record.get("seq")
+    if not device or not isinstance(seq, int):
+        return None
+    return device, record.get("epoch", ""), seq
+
+
+class SyncManager:
+    """Publishes this device's sessions to a shared directory and imports everyone else's."""
+
+    def __init__(self, storage_manager: StorageManager, sync_dir: Path, device_id: Optional[str] = None) -> None:
+        self.storage_manager = storage_manager
+        self.shared_dir = sync_dir
+        # Named timers sync with the same-named namespace on other devices
+        self.sync_dir = sync_dir if storage_manager.namespace is None else sync_dir / storage_manager.sessions_subdir
+        self.device_id = device_id or load_device_id(storage_manager)
+        self.state_file = f"{storage_manager.sessions_subdir}/{STATE_FILE}"
+        self.published_file = f"{storage_manager.sessions_subdir}/{PUBLISHED_FILE}"
+        self.unpublished_path = storage_manager.sessions_dir / UNPUBLISHED_FILE
+        self.merge_interval = MERGE_INTERVAL
+        self.publish_error: Optional[str] = None
+        self._last_merge: Optional[float] = None
+
+    @classmethod
+    def from_settings(cls, storage_manager: StorageManager, sync_dir: Optional[str] = None,
+                      remember: bool = True) -> Optional["SyncManager"]:
+        """Return a manager for the configured directory, if any, or for a --sync-dir (or "off").
+
+        A --sync-dir is saved for later runs unless ``remember`` is false.
+        """
+        if sync_dir is None:
+            configured = storage_manager.load_json(SETTINGS_FILE).get("sync_dir")
+        else:
+            configured = None if sync_dir == DISABLE else str(Path(sync_dir).expanduser().resolve())
+            if remember:
+                storage_manager.save_json(SETTINGS_FILE, {"sync_dir": configured} if configured else {})
+
+        return cls(storage_manager, Path(configured)) if configured else None
+
+    @property
+    def log_path(self) -> Path:
+        return self.sync_dir / f"{self.device_id}.jsonl"
+
+    def start(self, statistics_manager: Optional[StatisticsManager] = None) -> int:
+        """Import what other devices recorded and publish sessions recorded from now on.
+
+        Returns how many sessions were imported; problems reaching the shared
+        directory are reported and otherwise leave the timer working offline.
+        """
+        try:
+            self._ensure_sync_dir()
+            if not self.log_path.exists() and not self.storage_manager.load_json(self.published_file):
+                self._publish_history()
+            self.publish_backlog()
+            imported = self.merge()
+        except OSError as e:
+            print(f"Warning: Could not sync with {self.sync_dir}: {e}", file=sys.stderr)
+            imported = 0
+
+        if statistics_manager:
+            statistics_manager.add_listener(self.publish_session)
+        return imported
+
+    def maybe_merge(self) -> int:
+        """Merge again if ``merge_interval`` has passed, so long-running processes see new sessions.
+
+        Called from loops that may own the terminal, so a shared directory that
+        is briefly unreachable is skipped silently and retried next interval.
+        """
+        now = time.monotonic()
+        if self._last_merge is not None and now - self._last_merge < self.merge_interval:
+            return 0
+        self._last_merge = now
+        return self.catch_up()
+
+    def catch_up(self) -> int:
+        """Publish any backlog and merge, treating an unreachable shared directory as nothing new."""
+        try:
+            self.publish_backlog()
+            return self.merge()
+        except OSError:
+            return 0
+
+    def publish_session(self, session: dict, persist_seconds: float = 0.0) -> None:
+        """Listener for ``StatisticsManager.record_session``.
+
+        Sessions that can't be published are kept locally and sent with the
+        next session, merge or start that reaches the shared directory. Curses
+        may own the terminal, so the error is kept for the caller to report.
+        """
+        try:
+            self.publish_backlog()
+            self.publish([session])
+        except OSError as e:
+            self._keep_unpublished(session)
+            self.publish_error = f"Could not publish session to {self.log_path} (will retry): {e}"
+
+    def publish_backlog(self) -> int:
+        """Publish sessions kept back while the shared directory was unreachable."""
+        try:
+            backlog = open(self.unpublished_path, 'r+b')
+        except FileNotFoundError:
+            return 0
+
+        with backlog:
+            # Held until the backlog is emptied, so two processes can't both publish it
+            fcntl.flock(backlog, fcntl.LOCK_EX)
+            sessions = []
+            for line in backlog.read().splitlines():
+                try:
+                    sessions.append(json.loads(line))
+                except ValueError:
+                    continue  # Cut short by a crash while it was being kept
+            if sessions:
+                self.publish(sessions)
+            backlog.truncate(0)
+        return len(sessions)
+
+    def _keep_unpublished(self, session: dict) -> None:
+        self.storage_manager.sessions_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.unpublished_path, 'ab') as backlog:
+            fcntl.flock(backlog, fcntl.LOCK_EX)
+            backlog.write(json.dumps(session, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    def publish(self, sessions: list) -> None:
+        """Append sessions to this device's log, numbering them after the last one written."""
+        self._ensure_sync_dir()
+        self.storage_manager.sessions_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, 'a+b') as log:
+            try:
+                fcntl.flock(log, fcntl.LOCK_EX)
+            except OSError:
+                pass  # Some network filesystems don't do locks; there is normally one writer anyway
+
+            (epoch, seq), needs_newline = self._last_record(log)
+            published = self.storage_manager.load_json(self.published_file)
+            if (epoch, seq) != (published.get("epoch"), published.get("seq")):
+                # Not the log we last wrote, so its numbers may already be taken
+                epoch, seq = uuid.uuid4().hex[:8], 0
+
+            lines = [b"\n"] if needs_newline else []
+            for session in sessions:
+                seq += 1
+                record = {"device": self.device_id, "epoch": epoch, "seq": seq, **session}
+                lines.append(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+            log.write(b"".join(lines))
+            log.flush()
+            os.fsync(log.fileno())
+            self.storage_manager.save_json(self.published_file, {"epoch": epoch, "seq": seq})
+
+    def merge(self) -> int:
+        """Import new sessions from other devices' logs into the local shards."""
+        self._last_merge = time.monotonic()
+        self.storage_manager.sessions_dir.mkdir(parents=True, exist_ok=True)
+        state = self.storage_manager.load_json(self.state_file)
+        files, last_seqs, imported, already_imported = self._collect(state)
+
+        if imported:
+            # Note what is about to be imported, so a crash mid-way can't import it twice
+            state["pending"] = {
+                "devices": sorted({record["device"] for record in imported}),
+                "shards": sorted({self.storage_manager.shard_key(datetime.fromisoformat(record["date"]))
+                                  for record in imported}),
+            }
+            self.storage_manager.save_json(self.state_file, state)
+            self.storage_manager.append_sessions(imported)
+
+        if imported or already_imported or files != state.get("files", {}):
+            self.storage_manager.save_json(self.state_file, {"files": files, "devices": last_seqs})
+        return len(imported)
+
+    def unmerged(self) -> list:
+        """Sessions that ``merge`` would import right now, found without writing anything."""
+        return self._collect(self.storage_manager.load_json(self.state_file))[2]
+
+    def _collect(self, state: dict) -> tuple[dict, dict, list, set]:
+        """Read what is new in other devices' logs since `state`.
+
+        Returns the updated file offsets and last seqs, the sessions to import,
+        and the sessions an interrupted merge already imported.
+        """
+        files = dict(state.get("files", {}))
+        last_seqs = {device: dict(epochs) for device, epochs in state.get("devices", {}).items()}
+        already_imported = self._recover(state.get("pending"), last_seqs)
+
+        candidates: dict[tuple, list] = {}
+        for path in self.sync_dir.glob("*.jsonl"):
+            if path.name == self.log_path.name:
+                continue
+
+            seen = files.get(path.name, {})
+            offset = seen.get("offset", 0)
+            size = path.stat().st_size
+            if size < offset or self._tail(path, offset) != seen.get("tail", ""):
+                # Replaced by a copy or restored from a backup; re-read it, relying on seq numbers
+                # to skip what we have
+                offset = 0
+            if size == offset:
+                continue
+
+            records, offset = read_jsonl_from(path, offset)
+            files[path.name] = {"offset": offset, "tail": self._tail(path, offset)}
+            for record in records:
+                key = record_key(record)
+                if key is None or key[0] == self.device_id:
+                    continue
+                device, epoch, seq = key
+                if seq <= last_seqs.get(device, {}).get(epoch, 0):
+                    continue
+                rank = (path.name != f"{device}.jsonl", json.dumps(record, sort_keys=True, ensure_ascii=False))
+                candidates.setdefault(key, []).append((rank, record))
+
+        imported = []
+        for key in sorted(candidates):
+            device, epoch, seq = key
+            epochs = last_seqs.setdefault(device, {})
+            epochs[epoch] = max(epochs.get(epoch, 0), seq)
+            if key not in already_imported:
+                imported.append(min(candidates[key], key=lambda candidate: candidate[0])[1])
+
+        return files, last_seqs, imported, already_imported
+
+    def _recover(self, pending: Optional[dict], last_seqs: dict) -> set:
+        """After an interrupted merge, find which of its sessions already reached the shards."""
+        if not pending:
+            return set()
+
+        devices = set(pending["devices"])
+        present = set()
+        for shard in pending["shards"]:
+            for record in self.storage_manager.read_shard(shard):
+                key = record_key(record)
+                if key and key[0] in devices and key[2] > last_seqs.get(key[0], {}).get(key[1], 0):
+                    present.add(key)
+        return present
+
+    def _publish_history(self) -> None:
+        """First sync on this device: share every session recorded here so far."""
+        sessions = []
+        for key in self.storage_manager.list_shards():
+            sessions.extend(
+                session for session in self.storage_manager.read_shard(key) if "device" not in session
+            )
+        self.publish(sessions)
+
+    def _ensure_sync_dir(self) -> None:
+        """Create this namespace's folder in the share, but never the share itself.
+
+        A share that isn't mounted must not quietly turn into a local folder.
+        """
+        if not self.shared_dir.is_dir():
+            raise FileNotFoundError(errno.ENOENT, "Sync folder not found (is it mounted?)", str(self.shared_dir))
+        self.sync_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _tail(path: Path, offset: int) -> str:
+        with open(path, 'rb') as f:
+            f.seek(max(0, offset - TAIL_BYTES))
+            return f.read(min(offset, TAIL_BYTES)).hex()
+
+    @staticmethod
+    def _last_record(log) -> tuple[tuple[Optional[str], int], bool]:
+        """The (epoch, seq) of the last record in the log, and whether it ends in a half-written line."""
+        size = log.seek(0, os.SEEK_END)
+        if size == 0:
+            return (None, 0), False
+
+        chunk = 4096
+        while True:
+            start = max(0, size - chunk)
+            log.seek(start)
+            tail = log.read(size - start)
+            lines = tail.rstrip(b"\n").split(b"\n")
+            complete = lines if start == 0 else lines[1:]
+            for line in reversed(complete):
+                try:
+                    record = json.loads(line)
+                    return (record.get("epoch"), record["seq"]), not tail.endswith(b"\n")
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    continue
+            if start == 0:
+                return (None, 0), not tail.endswith(b"\n")
+            chunk *= 4
+
+
+def start_sync(statistics_manager: StatisticsManager, sync_dir: Optional[str] = None,
+               compact: bool = True) -> Optional[SyncManager]:
+    """Sync a stats namespace, if syncing is configured, then start its compaction.
+
+    Merging comes first so that compaction, which folds imported sessions
+    into summaries, sees them. Pass ``compact=False`` to start compaction
+    later yourself, e.g. after a fork.
+    """
+    sync_manager = SyncManager.from_settings(statistics_manager.storage_manager, sync_dir)
+    if sync_manager:
+        sync_manager.start(statistics_manager)
+    if compact:
+        statistics_manager.start_compaction()
+    return sync_manager
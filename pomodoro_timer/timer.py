@@ -1,13 +1,16 @@
-import time
 import curses
+import time
 
 from typing import Optional
 from _curses import window
 
+from pomodoro_timer import clock
 from pomodoro_timer.config import PomodoroConfig
 from pomodoro_timer.statistics import StatisticsManager
 from pomodoro_timer.theme_manager import ThemeManager
 from pomodoro_timer.ascii_numbers import ASCIINumbers
+from pomodoro_timer.layout import CountdownLayout, LayoutEngine
+from pomodoro_timer.metrics import MetricsExporter
 from pomodoro_timer.progress_bar import ProgressBar
 from pomodoro_timer.sound_manager import SoundManager
 from pomodoro_timer.timer_state import TimerState
@@ -22,13 +25,17 @@ class PomodoroTimer:
             theme_manager: ThemeManager,
             sound_manager: SoundManager,
             statistics_manager: StatisticsManager,
+            metrics: Optional[MetricsExporter] = None,
     ):
         self.config = config
         self.theme_manager = theme_manager
         self.sound_manager = sound_manager
         self.statistics_manager = statistics_manager
+        self.metrics = metrics
         self.stdscr: Optional[window] = None
         self.color_pair: int = 0
+        self.layout_engine: Optional[LayoutEngine] = None
+        self._needs_full_redraw = True
 
     def start(self):
         try:
@@ -43,33 +50,51 @@ class PomodoroTimer:
         try:
             self._show_welcome_screen()
 
-            for cycle in range(self.config.number_of_cycles):
-                work_result = self._run_work_session(cycle + 1)
-                if work_result == TimerState.QUIT:
+            # Each set runs to completion and returns here, so running sets all
+            # day keeps a constant stack depth instead of nesting a call per set.
+            sets_completed = 0
+            while True:
+                result = self._run_pomodoro_set()
+                if self.metrics:
+                    self.metrics.set_phase("idle")
+                if result == TimerState.QUIT:
                     self._show_exit_message()
                     return
 
-                if cycle < self.config.number_of_cycles - 1:
-                    break_result = self._run_short_break(cycle + 1)
-                    if break_result == TimerState.QUIT:
-                        self._show_exit_message()
-                        return
-                else:
-                    long_break_result = self._run_long_break()
-                    if long_break_result == TimerState.QUIT:
-                        self._show_exit_message()
-                        return
-
-            self._show_completion_screen()
+                sets_completed += 1
+                if self.config.sets and sets_completed >= self.config.sets:
+                    self._show_completion_screen()
+                    return
+                if not self._show_completion_screen(ask_to_continue=True):
+                    return
 
         except KeyboardInterrupt:
             self._show_exit_message()
 
+    def _run_pomodoro_set(self) -> TimerState:
+        """Run one set of work sessions and breaks; returns QUIT if the user quit part-way."""
+        for cycle in range(self.config.number_of_cycles):
+            work_result = self._run_work_session(cycle + 1)
+            if work_result == TimerState.QUIT:
+                return TimerState.QUIT
+
+            if cycle < self.config.number_of_cycles - 1:
+                break_result = self._run_short_break(cycle + 1)
+                if break_result == TimerState.QUIT:
+                    return TimerState.QUIT
+            else:
+                long_break_result = self._run_long_break()
+                if long_break_result == TimerState.QUIT:
+                    return TimerState.QUIT
+
+        return TimerState.COMPLETED
+
     def _initialize_curses(self):
         curses.curs_set(0)
+        # Input is polled between clock.sleep() calls, so getch() must never block here
         self.stdscr.nodelay(True)
-        self.stdscr.timeout(100)
         self.stdscr.keypad(True)
+        self.layout_engine = LayoutEngine(self.stdscr)
 
         if curses.has_colors():
             curses.start_color()
@@ -79,24 +104,27 @@ class PomodoroTimer:
             self.color_pair = curses.color_pair(1)
 
     def _get_screen_dimensions(self):
-        height, width = self.stdscr.getmaxyx()
-        return height, width
+        return self.layout_engine.height, self.layout_engine.width
+
+    def _handle_resize(self):
+        self.layout_engine.handle_resize()
+        self._clear_screen()
 
     def _clear_screen(self):
         self.stdscr.clear()
         self.stdscr.refresh()
+        self._needs_full_redraw = True
 
     def _display_centered(self, content: str, y_offset: int = 0, bold: bool = False):
-        height, width = self._get_screen_dimensions()
+        height, _ = self._get_screen_dimensions()
         lines = content.split('\n')
-        start_y = max(0, (height - len(lines)) // 2 + y_offset)
 
         attr = self.color_pair
         if bold:
             attr |= curses.A_BOLD
 
         max_line_width = max(len(line.rstrip()) for line in lines) if lines else 0
-        block_start_x = max(0, (width - max_line_width) // 2)
+        start_y, block_start_x = self.layout_engine.block_origin(len(lines), max_line_width, y_offset)
 
         for i, line in enumerate(lines):
             y_pos = start_y + i
@@ -119,21 +147,33 @@ class PomodoroTimer:
 
         content = f"{logo}\n\n{welcome_message}" if logo else welcome_message
         self._display_centered(content)
-        time.sleep(2)
+        self._hold_screen(content, 2)
 
     def _show_session_intro(self, ascii_art: str, message: str):
         self._clear_screen()
         content = f"{ascii_art}\n\n{message}" if ascii_art else message
         self._display_centered(content)
-        time.sleep(2)
+        self._hold_screen(content, 2)
+
+    def _hold_screen(self, content: str, seconds: float):
+        """Keep a centered message on screen, re-centering it if the terminal is resized."""
+        deadline = clock.monotonic() + seconds
+        while clock.monotonic() < deadline:
+            clock.sleep(0.1)
+            key = self.stdscr.getch()
+            if key == curses.KEY_RESIZE:
+                self._handle_resize()
+                self._display_centered(content)
+            elif key != -1:
+                # Hand it on, so e.g. P pressed during an intro pauses the countdown that follows
+                curses.ungetch(key)
+                clock.sleep(max(0.0, deadline - clock.monotonic()))
+                return
 
     def _render_countdown_display(self, seconds: int, total_seconds: int,
-                                   progress_bar, static_lines: list,
-                                   static_height: int, layout_start_y: int,
+                                   progress_bar: ProgressBar, layout: CountdownLayout,
                                    last_milestone: str) -> str:
         """Render the countdown display and return the current milestone."""
-        height, width = self._get_screen_dimensions()
-
         mins, secs = divmod(seconds, 60)
         ascii_timer = ASCIINumbers.render_time(mins, secs)
         timer_lines = ascii_timer.split('\n')
@@ -144,60 +184,47 @@ class PomodoroTimer:
         milestone = progress_bar.get_milestone_message(percentage)
 
         attr = self.color_pair | curses.A_BOLD
-        ascii_timer_height = 6
-
-        current_y = layout_start_y
-
-        max_static_width = max(len(line.rstrip()) for line in static_lines) if static_lines else 0
-        static_block_x = max(0, (width - max_static_width) // 2)
-
-        for i, line in enumerate(static_lines):
-            y_pos = current_y + i
-            if 0 <= y_pos < height:
-                self.stdscr.move(y_pos, 0)
-                self.stdscr.clrtoeol()
-                stripped_line = line.rstrip()
-                self._safe_addstr(y_pos, static_block_x, stripped_line, attr)
-
-        timer_start_y = current_y + static_height + 2
-
-        max_timer_width = max(len(line) for line in timer_lines) if timer_lines else 0
-        timer_block_x = max(0, (width - max_timer_width) // 2)
-
+        full_redraw = self._needs_full_redraw
+        self._needs_full_redraw = False
+
+        # The static art and message never change mid-session, so only draw
+        # them after the screen was cleared (session start, resume, resize).
+        if full_redraw:
+            for i, line in enumerate(layout.static_lines):
+                y_pos = layout.start_y + i
+                if layout.visible(y_pos):
+                    self._safe_addstr(y_pos, layout.static_x, line, attr)
+
+        timer_block_x = layout.center_x(len(timer_lines[0]))
         for i, line in enumerate(timer_lines):
-            y_pos = timer_start_y + i
-            if 0 <= y_pos < height:
+            y_pos = layout.timer_y + i
+            if layout.visible(y_pos):
                 self.stdscr.move(y_pos, 0)
                 self.stdscr.clrtoeol()
                 self._safe_addstr(y_pos, timer_block_x, line, attr)
 
-        progress_start_y = timer_start_y + ascii_timer_height + 2
-
         if milestone:
-            milestone_y = progress_start_y
-            if 0 <= milestone_y < height:
-                self.stdscr.move(milestone_y, 0)
+            if layout.visible(layout.milestone_y):
+                self.stdscr.move(layout.milestone_y, 0)
                 self.stdscr.clrtoeol()
-                line_x = max(0, (width - len(milestone)) // 2)
-                self._safe_addstr(milestone_y, line_x, milestone, self.color_pair)
+                self._safe_addstr(layout.milestone_y, layout.center_x(len(milestone)), milestone, self.color_pair)
         elif last_milestone:
-            milestone_y = progress_start_y
-            if 0 <= milestone_y < height:
-                self.stdscr.move(milestone_y, 0)
+            if layout.visible(layout.milestone_y):
+                self.stdscr.move(layout.milestone_y, 0)
                 self.stdscr.clrtoeol()
 
-        progress_y = progress_start_y + 2 if milestone else progress_start_y
-        if 0 <= progress_y < height:
+        progress_y = layout.progress_with_milestone_y if milestone else layout.progress_y
+        if layout.visible(progress_y):
             self.stdscr.move(progress_y, 0)
             self.stdscr.clrtoeol()
-            line_x = max(0, (width - len(progress_display)) // 2)
-            self._safe_addstr(progress_y, line_x, progress_display, attr)
+            self._safe_addstr(progress_y, layout.center_x(len(progress_display)), progress_display, attr)
 
-        controls = "Press [P] to Pause  |  Press Ctrl+C to quit"
-        if height - 2 > progress_y + 3:
-            self.stdscr.move(height - 2, 0)
-            self.stdscr.clrtoeol()
-            self._safe_addstr(height - 2, (width - len(controls)) // 2, controls, curses.A_DIM)
+        if full_redraw or bool(milestone) != bool(last_milestone):
+            controls = "Press [P] to Pause  |  Press Ctrl+C to quit"
+            if layout.shows_controls(progress_y):
+                self.stdscr.move(layout.controls_y, 0)
+                self.stdscr.clrtoeol()
+                self._safe_addstr(layout.controls_y, layout.center_x(len(controls)), controls, curses.A_DIM)
 
         self.stdscr.refresh()
         return milestone
@@ -205,7 +232,32 @@ class PomodoroTimer:
     def _show_pause_menu(self, elapsed_seconds: int, total_seconds: int,
                         session_type: str) -> str:
         """Display pause menu overlay and return user's choice."""
-        height, width = self._get_screen_dimensions()
+        self._draw_pause_menu(elapsed_seconds, total_seconds, session_type)
+
+        # Temporarily enable blocking input for menu
+        self.stdscr.nodelay(False)
+        while True:
+            key = self.stdscr.getch()
+
+            if key in [ord('r'), ord('R'), ord('p'), ord('P')]:
+                self.stdscr.nodelay(True)  # Restore non-blocking
+                return 'resume'
+            elif key in [ord('s'), ord('S')]:
+                self.stdscr.nodelay(True)
+                return 'skip'
+            elif key in [ord('t'), ord('T')]:
+                self.stdscr.nodelay(True)
+                return 'restart'
+            elif key in [ord('q'), ord('Q')]:
+                self.stdscr.nodelay(True)
+                return 'quit'
+            elif key == curses.KEY_RESIZE:
+                self._handle_resize()
+                self._draw_pause_menu(elapsed_seconds, total_seconds, session_type)
+
+    def _draw_pause_menu(self, elapsed_seconds: int, total_seconds: int,
+                         session_type: str):
+        height, _ = self._get_screen_dimensions()
 
         elapsed_minutes = elapsed_seconds / 60
         total_minutes = total_seconds / 60
@@ -213,8 +265,7 @@ class PomodoroTimer:
 
         menu_width = 60
         menu_height = 14
-        menu_y = (height - menu_height) // 2
-        menu_x = (width - menu_width) // 2
+        menu_y, menu_x = self.layout_engine.block_origin(menu_height, menu_width)
 
         menu_lines = [
             "╔" + "═" * (menu_width - 2) + "╗",
@@ -240,24 +291,6 @@ class PomodoroTimer:
 
         self.stdscr.refresh()
 
-        # Temporarily enable blocking input for menu
-        self.stdscr.nodelay(False)
-        while True:
-            key = self.stdscr.getch()
-
-            if key in [ord('r'), ord('R'), ord('p'), ord('P')]:
-                self.stdscr.nodelay(True)  # Restore non-blocking
-                return 'resume'
-            elif key in [ord('s'), ord('S')]:
-                self.stdscr.nodelay(True)
-                return 'skip'
-            elif key in [ord('t'), ord('T')]:
-                self.stdscr.nodelay(True)
-                return 'restart'
-            elif key in [ord('q'), ord('Q')]:
-                self.stdscr.nodelay(True)
-                return 'quit'
-
     def _run_countdown(self, minutes: int, session_display: str,
                        session_type: str, ascii_art: str = "") -> TimerState:
         """Run countdown with pause/resume capability."""
@@ -265,10 +298,6 @@ class PomodoroTimer:
         seconds = total_seconds
         state = TimerState.RUNNING
 
-        height, width = self._get_screen_dimensions()
-        progress_bar_width = min(60, width - 20)
-        progress_bar = ProgressBar(width=progress_bar_width)
-
         self._clear_screen()
 
         if ascii_art:
@@ -276,36 +305,46 @@ class PomodoroTimer:
         else:
             static_content = session_display
 
-        static_lines = static_content.split('\n')
-        static_height = len(static_lines)
-
-        ascii_timer_height = 6
-        progress_bar_height = 3
-        spacing = 4
-
-        total_layout_height = static_height + spacing + ascii_timer_height + spacing + progress_bar_height
-        layout_start_y = max(0, (height - total_layout_height) // 2)
+        layout = self.layout_engine.countdown_layout(static_content)
+        progress_bar = ProgressBar(width=layout.progress_bar_width)
 
         last_milestone = ""
 
         while seconds > 0 and state == TimerState.RUNNING:
+            render_started = time.perf_counter()
             last_milestone = self._render_countdown_display(
-                seconds, total_seconds, progress_bar, static_lines,
-                static_height, layout_start_y, last_milestone
+                seconds, total_seconds, progress_bar, layout, last_milestone
             )
+            if self.metrics:
+                self.metrics.observe_render(time.perf_counter() - render_started)
+                self.metrics.set_phase("running", session_type, seconds)
 
             # Non-blocking sleep with input checking (10 x 0.1s = 1 second)
             for _ in range(10):
-                time.sleep(0.1)
+                clock.sleep(0.1)
                 key = self.stdscr.getch()
 
-                if key in [ord('p'), ord('P')]:
+                if key == curses.KEY_RESIZE:
+                    self._handle_resize()
+                    layout = self.layout_engine.countdown_layout(static_content)
+                    progress_bar = ProgressBar(width=layout.progress_bar_width)
+                    last_milestone = self._render_countdown_display(
+                        seconds, total_seconds, progress_bar, layout, ""
+                    )
+
+                elif key in [ord('p'), ord('P')]:
                     state = TimerState.PAUSED
                     elapsed_seconds = total_seconds - seconds
+                    if self.metrics:
+                        self.metrics.set_phase("paused", session_type, seconds)
 
                     menu_result = self._show_pause_menu(
                         elapsed_seconds, total_seconds, session_type
                     )
+                    # The terminal may have been resized while the menu was open
+                    layout = self.layout_engine.countdown_layout(static_content)
+                    if progress_bar.width != layout.progress_bar_width:
+                        progress_bar = ProgressBar(width=layout.progress_bar_width)
 
                     if menu_result == 'resume':
                         state = TimerState.RUNNING
@@ -316,7 +355,7 @@ class PomodoroTimer:
                         elapsed_minutes = elapsed_seconds / 60
                         if elapsed_minutes >= 1:
                             self.statistics_manager.record_session(
-                                session_type, elapsed_minutes
+                                session_type, elapsed_minutes, partial=True
                             )
                         return TimerState.SKIPPED
                     elif menu_result == 'restart':
@@ -329,7 +368,7 @@ class PomodoroTimer:
                         elapsed_minutes = elapsed_seconds / 60
                         if elapsed_minutes >= 1:
                             self.statistics_manager.record_session(
-                                session_type, elapsed_minutes
+                                session_type, elapsed_minutes, partial=True
                             )
                         return TimerState.QUIT
 
@@ -379,21 +418,27 @@ class PomodoroTimer:
 
         return result
 
-    def _show_completion_screen(self):
+    def _show_completion_screen(self, ask_to_continue: bool = False) -> bool:
+        """Celebrate a finished set; returns whether another set should start."""
         self._clear_screen()
         completion_message = "✨ Pomodoro session complete! ✨\n\nWhat did you create in this time?"
         self._display_centered(completion_message)
-        time.sleep(2)
+        self._hold_screen(completion_message, 2)
 
-        self._prompt_restart()
+        if not ask_to_continue:
+            return False
+        if self.config.auto_continue:
+            return True
+        return self._prompt_restart()
 
-    def _prompt_restart(self):
+    def _prompt_restart(self) -> bool:
         self._clear_screen()
         prompt = "Start another session? (y/n)"
         self._display_centered(prompt)
 
         curses.curs_set(1)
         curses.echo()
+        self.stdscr.nodelay(False)
 
         height, width = self._get_screen_dimensions()
 
@@ -406,15 +451,20 @@ class PomodoroTimer:
                 if key in [ord('y'), ord('Y')]:
                     curses.curs_set(0)
                     curses.noecho()
-                    self._run_timer_loop(self.stdscr)
-                    break
+                    self.stdscr.nodelay(True)
+                    return True
                 elif key in [ord('n'), ord('N')]:
-                    break
+                    return False
+                elif key == curses.KEY_RESIZE:
+                    self._handle_resize()
+                    self._display_centered(prompt)
+                    height, width = self._get_screen_dimensions()
             except KeyboardInterrupt:
-                break
+                return False
 
     def _show_exit_message(self):
         self._clear_screen()
-        self._display_centered("👋 Timer stopped.\nSee you next time!")
+        exit_message = "👋 Timer stopped.\nSee you next time!"
+        self._display_centered(exit_message)
         self.stdscr.refresh()
-        time.sleep(1)
\ No newline at end of file
+        self._hold_screen(exit_message, 1)
\ No newline at end of file
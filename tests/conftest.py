@@ -0,0 +1,8 @@
+import pytest
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Point ~/.pomodoro at a throwaway directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
@@ -0,0 +1,74 @@
+import time
+
+import pytest
+
+pytest.importorskip("playsound")  # The daemon plays the end-of-phase sound
+
+from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.daemon import PomodoroDaemon
+from pomodoro_timer.statistics import StatisticsManager
+from pomodoro_timer.status_file import StatusWriter, read_status
+from pomodoro_timer.storage import StorageManager
+
+
+@pytest.fixture
+def daemon(home):
+    """A daemon with its main timer running, driven through handle_command without a socket."""
+    def make(name=None):
+        config = PomodoroConfig()
+        config.name = name
+        storage_manager = StorageManager(namespace=name)
+        statistics_manager = StatisticsManager(storage_manager)
+        daemon = PomodoroDaemon(config, storage_manager, statistics_manager)
+        daemon.status_writer = StatusWriter(str(home / "status"))
+        daemon.scheduler.add(daemon.main_timer, time.time(), statistics_manager=statistics_manager)
+        daemon.running = True
+        return daemon
+    return make
+
+
+def test_pause_resume_and_skip_the_main_timer(daemon, home):
+    d = daemon()
+    assert d.handle_command("status")["state"] == "running"
+
+    reply = d.handle_command("pause")
+    assert reply["ok"] and reply["state"] == "paused"
+    assert read_status(str(home / "status"))["state"] == "paused"
+    assert d.handle_command("pause")["ok"] is False
+
+    assert d.handle_command("resume")["state"] == "running"
+    assert d.handle_command("skip")["phase"] == "short_break"
+    assert d.handle_command("start")["phase"] == "work"
+
+
+def test_named_timers_are_added_listed_and_removed(daemon):
+    d = daemon()
+    assert d.handle_command("add writing")["name"] == "writing"
+    assert d.handle_command("add writing") == {"ok": False, "error": "A timer named 'writing' already exists"}
+    assert set(d.handle_command("list")["timers"]) == {"default", "writing"}
+
+    assert d.handle_command("pause writing")["state"] == "paused"
+    assert d.handle_command("status")["state"] == "running"
+
+    assert d.handle_command("remove writing") == {"ok": True}
+    assert d.handle_command("status writing") == {"ok": False, "error": "No timer named 'writing'"}
+
+
+def test_main_timer_follows_name_and_can_only_be_stopped(daemon):
+    d = daemon("alice")
+    assert d.handle_command("status")["name"] == "alice"
+    assert "main timer" in d.handle_command("remove alice")["error"]
+
+    d.handle_command("add bob")
+    assert "use remove bob" in d.handle_command("stop bob")["error"]
+    assert d.running
+
+    assert d.handle_command("stop") == {"ok": True, "state": "quit"}
+    assert d.running is False
+    assert d.scheduler.timers == {}
+
+
+def test_bad_commands(daemon):
+    d = daemon()
+    assert d.handle_command("") == {"ok": False, "error": "empty command"}
+    assert d.handle_command("explode") == {"ok": False, "error": "unknown command 'explode'"}
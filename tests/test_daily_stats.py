@@ -0,0 +1,89 @@
+from datetime import date, datetime
+
+import pytest
+
+from pomodoro_timer.daily_stats import DailyStatsCache
+from pomodoro_timer.file_watcher import FileWatcher
+from pomodoro_timer.storage import StorageManager
+
+
+def session(day: str, session_type: str = "work", duration: float = 25) -> dict:
+    return {"date": f"{day}T09:00:00", "type": session_type, "duration": duration, "partial": False}
+
+
+@pytest.fixture
+def storage(home):
+    storage = StorageManager()
+    storage.append_sessions([session("2026-09-30"), session("2026-10-01"), session("2026-10-01", "short_break", 5)])
+    return storage
+
+
+@pytest.fixture
+def cache(storage):
+    cache = DailyStatsCache(storage)
+    cache.ensure_loaded()
+    return cache
+
+
+def test_refresh_folds_in_appended_sessions_only(storage, cache):
+    assert cache.refresh() == 0
+    storage.append_session(session("2026-10-02"))
+
+    assert cache.refresh() == 1
+    assert cache.totals() == {"work": 3, "short_break": 1, "long_break": 0, "total": 4, "work_minutes": 75}
+    assert cache.refresh() == 0
+
+
+def test_half_written_line_waits_until_it_is_complete(storage, cache):
+    path = storage.get_shard_path("2026-10")
+    line = b'{"date": "2026-10-03T09:00:00", "type": "work", "duration": 25, "partial": false}\n'
+    with open(path, 'ab') as f:
+        f.write(line[:30])
+    assert cache.refresh() == 0
+
+    with open(path, 'ab') as f:
+        f.write(line[30:])
+    assert cache.refresh() == 1
+    assert cache.days[date(2026, 10, 3)]["work"] == 1
+
+
+def test_rewritten_shard_is_reloaded(storage, cache):
+    # Same size or larger would fool an offset check; the new inode gives it away
+    storage.rewrite_shard("2026-10", [session("2026-10-05"), session("2026-10-06"), session("2026-10-07")])
+
+    assert cache.refresh() == 3
+    assert date(2026, 10, 1) not in cache.days
+    assert cache.totals()["work"] == 4
+
+
+def test_new_shard_in_the_covered_range_is_picked_up(storage, cache):
+    storage.append_session(session("2026-11-01"))
+    assert cache.refresh() == 1
+    assert cache.days[date(2026, 11, 1)]["total"] == 1
+
+
+def test_range_loading_reads_only_the_shards_it_needs(storage):
+    cache = DailyStatsCache(storage)
+    cache.ensure_range_loaded(datetime(2026, 10, 1), datetime(2026, 10, 31))
+    assert set(cache.days) == {date(2026, 10, 1)}
+
+    # Outside any range it was asked for, a new shard stays unread
+    storage.append_session(session("2026-12-01"))
+    assert cache.refresh() == 0
+
+
+@pytest.mark.parametrize("inotify", [True, False])
+def test_watcher_reports_appends(storage, monkeypatch, inotify):
+    if not inotify:
+        monkeypatch.setattr(FileWatcher, "_init_inotify", lambda self: None)
+    watcher = FileWatcher(storage.sessions_dir, poll_interval=0)
+    if inotify and not watcher.uses_inotify:
+        pytest.skip("inotify isn't available here")
+
+    try:
+        assert not watcher.has_changed()
+        storage.append_session(session("2026-10-02", duration=30))
+        assert watcher.has_changed()
+        assert not watcher.has_changed()
+    finally:
+        watcher.close()
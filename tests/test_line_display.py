@@ -0,0 +1,140 @@
+import io
+import random
+import re
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("playsound")  # line_display pulls in the sound manager
+
+from pomodoro_timer import clock
+from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.line_display import LineTimer, StatusLineRenderer
+from pomodoro_timer.theme_manager import ThemeManager
+from pomodoro_timer.timer_state import TimerState
+
+
+class OneLineTerminal:
+    """Just the terminal behaviour StatusLineRenderer relies on, for a single line."""
+
+    CONTROL = re.compile(r"\r|\x08|\033\[(\d*)C|\033\[K|.", re.DOTALL)
+
+    def __init__(self):
+        self.cells: list[str] = []
+        self.cursor = 0
+
+    def write(self, text: str) -> None:
+        for match in self.CONTROL.finditer(text):
+            token = match.group(0)
+            if token == "\r":
+                self.cursor = 0
+            elif token == "\b":
+                self.cursor = max(0, self.cursor - 1)
+            elif token.startswith("\033[") and token.endswith("C"):
+                self.cursor += int(match.group(1) or 1)
+            elif token == "\033[K":
+                del self.cells[self.cursor:]
+            else:
+                self.cells.extend(" " * (self.cursor + 1 - len(self.cells)))
+                self.cells[self.cursor] = token
+                self.cursor += 1
+
+    def flush(self) -> None:
+        pass
+
+    @property
+    def line(self) -> str:
+        return "".join(self.cells)
+
+
+def test_renderer_matches_a_terminal_model():
+    rng = random.Random(1234)
+    terminal = OneLineTerminal()
+    renderer = StatusLineRenderer(terminal)
+    line = "Work 1/4  25:00  [                    ]"
+
+    for _ in range(5_000):
+        chars = list(line)
+        edit = rng.random()
+        if edit < 0.6 and chars:
+            chars[rng.randrange(len(chars))] = rng.choice("0123456789 :#")
+        elif edit < 0.8:
+            chars.insert(rng.randrange(len(chars) + 1), rng.choice("abc (paused)"))
+        elif chars:
+            del chars[rng.randrange(len(chars)):rng.randrange(len(chars) + 1) or None]
+        line = "".join(chars)
+
+        renderer.render(line)
+        assert terminal.line.rstrip() == line.rstrip()
+        assert terminal.cursor == renderer.cursor
+
+
+def test_countdown_tick_rewrites_only_the_changed_digit():
+    stream = io.StringIO()
+    renderer = StatusLineRenderer(stream)
+    renderer.render("Work 1/4  24:59")
+    written = len(stream.getvalue())
+
+    renderer.render("Work 1/4  24:58")
+    assert stream.getvalue()[written:] == "\b8"
+    renderer.render("Work 1/4  24:58")
+    assert len(stream.getvalue()) == written + 2
+
+
+@pytest.fixture
+def line_timer():
+    def make(display: str, metrics=None) -> LineTimer:
+        config = PomodoroConfig()
+        config.display = display
+        config.work_mins = config.short_break_mins = config.long_break_mins = 1
+        config.number_of_cycles = 2
+        stream = io.StringIO()
+        sounds = mock.Mock()
+        return LineTimer(config, ThemeManager(), sounds, mock.Mock(), stream=stream, metrics=metrics)
+    return make
+
+
+def test_compact_mode_wakes_when_the_shown_second_changes(line_timer):
+    timer = line_timer("compact")
+    timer.cycle.start(1000.0)
+
+    assert timer._next_wakeup(1000.0) == pytest.approx(1.0)
+    assert timer._next_wakeup(1000.7) == pytest.approx(0.3)
+    assert timer._next_wakeup(1059.5) == pytest.approx(0.5)
+
+    timer.cycle.pause(1010.0)
+    assert timer._next_wakeup(1010.0) is None
+
+
+def test_plain_mode_wakes_only_at_the_phase_end(line_timer):
+    timer = line_timer("plain")
+    timer.cycle.start(1000.0)
+    assert timer._next_wakeup(1010.0) == pytest.approx(50.0)
+
+    metrics = mock.Mock(interval=15.0)
+    timer = line_timer("plain", metrics=metrics)
+    timer.cycle.start(1000.0)
+    assert timer._next_wakeup(1010.0) == pytest.approx(15.0)
+    assert timer._next_wakeup(1050.0) == pytest.approx(10.0)
+
+
+def test_plain_mode_writes_one_line_per_event(line_timer):
+    timer = line_timer("plain")
+    now = [1000.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    with mock.patch.object(clock, "now", lambda: now[0]), mock.patch.object(clock, "sleep", sleep):
+        timer.start()
+
+    events = [line.split(" ", 1)[1] for line in timer.stream.getvalue().splitlines()]
+    assert events == [
+        "started Work 1/2 (1 min)",
+        "started Short break 1/2 (1 min)",
+        "started Work 2/2 (1 min)",
+        "started Long break 2/2 (1 min)",
+        "completed all cycles",
+    ]
+    assert timer.cycle.state == TimerState.COMPLETED
+    assert timer.sound_manager.play_notification.call_count == 4
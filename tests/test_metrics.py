@@ -0,0 +1,32 @@
+from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.metrics import MetricsExporter
+from pomodoro_timer.pomodoro_cycle import PomodoroCycle
+from pomodoro_timer.statistics import StatisticsManager
+from pomodoro_timer.storage import StorageManager
+
+
+def test_sessions_are_counted_by_how_they_ended(home):
+    statistics_manager = StatisticsManager(StorageManager())
+    metrics = MetricsExporter(str(home / "pomodoro.prom"))
+    statistics_manager.add_listener(metrics.observe_session)
+
+    cycle = PomodoroCycle(PomodoroConfig(), statistics_manager)
+    cycle.start(0.0)
+    cycle.skip(120.0)  # A whole number of minutes, but still cut short
+    cycle.advance(cycle.next_deadline)  # The short break runs to the end
+
+    assert metrics.partial == {"work": 1, "short_break": 0, "long_break": 0}
+    assert metrics.completed == {"work": 0, "short_break": 1, "long_break": 0}
+    assert [session["partial"] for session in statistics_manager.get_sessions()] == [True, False]
+
+
+def test_write_errors_are_kept_for_after_the_timer(home, capsys):
+    blocker = home / "not-a-dir"
+    blocker.write_text("")
+    metrics = MetricsExporter(str(blocker / "pomodoro.prom"))
+
+    metrics.write()
+    metrics.write()
+
+    assert capsys.readouterr().err == ""
+    assert metrics.error.startswith(f"Could not write metrics to {blocker / 'pomodoro.prom'}")
@@ -0,0 +1,129 @@
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+
+from pomodoro_timer.query import PERIOD_COLUMNS, TYPE_COLUMNS, RowWriter, SessionQuery, ShardIndex
+from pomodoro_timer.storage import StorageManager
+
+
+def session(day: str, session_type: str = "work", duration: float = 25, partial: bool = False) -> dict:
+    return {"date": f"{day}T09:00:00", "type": session_type, "duration": duration, "partial": partial}
+
+
+@pytest.mark.parametrize("day, group_by, label, end", [
+    (date(2026, 10, 19), "day", "2026-10-19", date(2026, 10, 20)),
+    (date(2026, 10, 19), "week", "2026-W43", date(2026, 10, 26)),   # Monday
+    (date(2026, 10, 25), "week", "2026-W43", date(2026, 10, 26)),   # Sunday
+    (date(2027, 1, 1), "week", "2026-W53", date(2027, 1, 4)),       # ISO week of the previous year
+    (date(2026, 12, 31), "month", "2026-12", date(2027, 1, 1)),
+    (date(2026, 2, 1), "month", "2026-02", date(2026, 3, 1)),
+    (date(2028, 2, 29), "month", "2028-02", date(2028, 3, 1)),
+])
+def test_period_labels_and_ends(day, group_by, label, end):
+    assert SessionQuery.period(day, group_by) == (label, end)
+
+
+@pytest.fixture
+def storage(home):
+    storage = StorageManager()
+    storage.append_sessions([
+        session("2026-08-31"),
+        session("2026-08-31", "short_break", 5),
+        session("2026-09-01", duration=12.5, partial=True),
+        session("2026-09-30", "long_break", 15),
+        session("2026-10-01"),
+    ])
+    return storage
+
+
+def test_grouping_by_type_and_week(storage):
+    query = SessionQuery(storage)
+    by_type = list(query.rows(None, date(2026, 10, 31), "type"))
+    assert by_type == [
+        {"type": "long_break", "sessions": 1, "partial": 0, "minutes": 15},
+        {"type": "short_break", "sessions": 1, "partial": 0, "minutes": 5},
+        {"type": "work", "sessions": 3, "partial": 1, "minutes": 62.5},
+    ]
+
+    # The week of Aug 31 spans the August and September shards
+    weeks = list(query.rows(date(2026, 8, 1), date(2026, 10, 31), "week"))
+    assert [(row["period"], row["total"], row["work_minutes"]) for row in weeks] == [
+        ("2026-W36", 3, 37.5), ("2026-W40", 2, 25),
+    ]
+
+
+def test_rows_stream_as_soon_as_shards_make_them_final(storage, monkeypatch):
+    query = SessionQuery(storage)
+    read = []
+    original = query.index.daily_summaries
+    monkeypatch.setattr(query.index, "daily_summaries", lambda key: read.append(key) or original(key))
+
+    rows = query.rows(None, date(2026, 10, 31), "month")
+    assert next(rows)["period"] == "2026-08"
+    assert read == ["2026-08"]
+    assert next(rows)["period"] == "2026-09"
+    assert read == ["2026-08", "2026-09"]
+    assert [row["period"] for row in rows] == ["2026-10"]
+
+
+def test_range_limits_days_within_a_shard(storage):
+    rows = list(SessionQuery(storage).rows(date(2026, 9, 2), date(2026, 9, 30), "day"))
+    assert [row["period"] for row in rows] == ["2026-09-30"]
+
+
+def test_index_follows_appends_and_rewrites(storage):
+    index = ShardIndex(storage)
+    assert index.daily_summaries("2026-09")[date(2026, 9, 1)]["counts"] == {"work": 1}
+    cached = json.loads((index.index_dir / "2026-09.json").read_text())
+    assert cached["offset"] == storage.get_shard_stat("2026-09").st_size
+
+    storage.append_session(session("2026-09-01"))
+    assert index.daily_summaries("2026-09")[date(2026, 9, 1)]["counts"] == {"work": 2}
+
+    # Rewritten in place by compaction: a new inode, so the index starts over
+    storage.rewrite_shard("2026-09", [session("2026-09-30", "long_break", 15)])
+    assert list(ShardIndex(storage).daily_summaries("2026-09")) == [date(2026, 9, 30)]
+
+
+def test_damaged_index_is_rebuilt(storage):
+    index = ShardIndex(storage)
+    index.daily_summaries("2026-10")
+    (index.index_dir / "2026-10.json").write_text("{not json")
+    assert index.daily_summaries("2026-10")[date(2026, 10, 1)]["counts"] == {"work": 1}
+
+
+ROWS = [
+    {"type": "work", "sessions": 3, "partial": 1, "minutes": 62.5},
+    {"type": "short_break", "sessions": 1, "partial": 0, "minutes": 5},
+]
+
+
+def write(output_format: str, rows: list, columns=TYPE_COLUMNS) -> str:
+    stream = io.StringIO()
+    writer = RowWriter(stream, output_format, columns)
+    for row in rows:
+        writer.write(row)
+    writer.finish()
+    return stream.getvalue()
+
+
+def test_json_output_is_one_array():
+    assert json.loads(write("json", ROWS)) == ROWS
+    assert json.loads(write("json", [])) == []
+
+
+def test_csv_output_has_a_header_even_when_empty():
+    assert list(csv.reader(io.StringIO(write("csv", ROWS)))) == [
+        list(TYPE_COLUMNS), ["work", "3", "1", "62.5"], ["short_break", "1", "0", "5"],
+    ]
+    assert write("csv", [], PERIOD_COLUMNS).strip() == ",".join(PERIOD_COLUMNS)
+
+
+def test_table_output_is_aligned():
+    lines = write("table", ROWS).splitlines()
+    assert lines[0].split() == list(TYPE_COLUMNS)
+    assert lines[1].split() == ["work", "3", "1", "62.5"]
+    assert len({len(line) for line in lines}) == 1
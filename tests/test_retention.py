@@ -0,0 +1,18 @@
+from pomodoro_timer.statistics import StatisticsManager
+from pomodoro_timer.storage import StorageManager
+
+
+def test_background_compaction_error_is_kept_for_later(home, monkeypatch, capsys):
+    statistics_manager = StatisticsManager(StorageManager(), retention_days=30)
+
+    def fail(now=None):
+        raise OSError("disk full")
+    monkeypatch.setattr(statistics_manager.retention, "compact", fail)
+
+    statistics_manager.retention.start_background().join()
+    assert capsys.readouterr().err == ""
+    assert statistics_manager.compaction_error() == "Session compaction stopped early: disk full"
+
+
+def test_no_compaction_error_without_retention(home):
+    assert StatisticsManager(StorageManager()).compaction_error() is None
@@ -0,0 +1,120 @@
+import pytest
+
+from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.scheduler import TimerScheduler
+from pomodoro_timer.timer_state import TimerState
+
+
+class Recorder:
+    """Stands in for StatisticsManager, so timers don't touch ~/.pomodoro."""
+
+    def __init__(self):
+        self.sessions = []
+
+    def record_session(self, session_type: str, duration: float, partial: bool = False) -> None:
+        self.sessions.append((session_type, duration, partial))
+
+
+def config(work: int = 25) -> PomodoroConfig:
+    config = PomodoroConfig()
+    config.work_mins = work
+    return config
+
+
+@pytest.fixture
+def scheduler():
+    return TimerScheduler(PomodoroConfig())
+
+
+def add(scheduler, name, now=0.0, work=25):
+    return scheduler.add(name, now, config=config(work), statistics_manager=Recorder())
+
+
+def test_due_timers_advance_in_deadline_order(scheduler):
+    add(scheduler, "slow", work=25)
+    add(scheduler, "quick", work=5)
+    add(scheduler, "middle", work=10)
+    add(scheduler, "also_quick", work=5)
+
+    assert scheduler.next_deadline() == 5 * 60
+    assert scheduler.run_due(4 * 60) == []
+    # Equal deadlines run in the order the timers were scheduled; a timer finishes every phase that has passed
+    assert scheduler.run_due(12 * 60) == [("quick", 2), ("also_quick", 2), ("middle", 1)]
+    assert scheduler.timers["quick"].session_type == "work"
+    assert scheduler.timers["quick"].cycle_number == 2
+    assert scheduler.next_deadline() == 15 * 60
+
+
+def test_paused_timer_entry_is_discarded(scheduler):
+    add(scheduler, "a", work=5)
+    add(scheduler, "b", work=10)
+
+    assert scheduler.pause("a", 60.0)
+    assert scheduler.next_deadline() == 10 * 60
+    assert len(scheduler._heap) == 1  # a's stale entry was dropped on the way
+
+    assert scheduler.run_due(10 * 60) == [("b", 1)]
+    assert scheduler.timers["a"].state == TimerState.PAUSED
+
+
+def test_resumed_timer_runs_at_its_new_deadline_only(scheduler):
+    cycle = add(scheduler, "a", work=5)
+    scheduler.pause("a", 60.0)
+    scheduler.resume("a", 120.0)  # A minute of pause pushes the deadline back a minute
+
+    assert scheduler.next_deadline() == 6 * 60
+    assert scheduler.run_due(5 * 60) == []
+    assert scheduler.run_due(6 * 60) == [("a", 1)]
+    assert cycle.session_type == "short_break"
+
+
+def test_skipped_phase_old_deadline_is_ignored(scheduler):
+    cycle = add(scheduler, "a", work=5)
+    assert scheduler.skip("a", 60.0)
+    assert cycle.session_type == "short_break"
+
+    # The work phase's deadline is stale; the break ends five minutes after the skip
+    assert scheduler.run_due(5 * 60) == []
+    assert scheduler.next_deadline() == 60 + 5 * 60
+    assert scheduler.run_due(6 * 60) == [("a", 1)]
+    assert cycle.session_type == "work"
+
+
+def test_removed_timer_is_never_run(scheduler):
+    add(scheduler, "a", work=5)
+    add(scheduler, "b", work=10)
+    scheduler.remove("a", 60.0)
+
+    assert "a" not in scheduler.timers
+    assert scheduler.next_deadline() == 10 * 60
+    assert scheduler.run_due(10 * 60) == [("b", 1)]
+    with pytest.raises(KeyError):
+        scheduler.pause("a", 0.0)
+
+
+def test_late_wakeup_catches_up_every_phase(scheduler):
+    add(scheduler, "a", work=5)
+    # Work 5 + break 5 + work 5 have all passed
+    assert scheduler.run_due(15 * 60) == [("a", 3)]
+    assert scheduler.timers["a"].session_type == "short_break"
+
+
+def test_ten_thousand_timers_under_a_fake_clock(scheduler):
+    recorder = Recorder()
+    for i in range(10_000):
+        scheduler.add(f"t{i}", float(i % 60), config=config(5), statistics_manager=recorder)
+    for i in range(0, 10_000, 10):
+        scheduler.pause(f"t{i}", 100.0)
+
+    # Half an hour of wakeups, each at the earliest live deadline
+    while scheduler.next_deadline() <= 1800:
+        scheduler.run_due(scheduler.next_deadline())
+
+    running = [cycle for cycle in scheduler.timers.values() if cycle.state == TimerState.RUNNING]
+    assert len(running) == 9_000
+    # No timer missed a phase: each is in the five minutes after the half hour
+    assert all(1800 < cycle.next_deadline <= 2100 for cycle in running)
+    # Started in the first minute (never at 0, as those were paused), so five phases each
+    assert len(recorder.sessions) == 9_000 * 5
+    # Stale entries from the pauses don't pile up
+    assert len(scheduler._heap) <= 10_000
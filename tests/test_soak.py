@@ -0,0 +1,16 @@
+import pytest
+
+pytest.importorskip("playsound")  # The full-screen timer pulls in the sound manager
+
+from tools.soak import run_cycle_soak, run_timer_soak
+
+
+def test_timer_loop_keeps_a_constant_stack_depth():
+    result = run_timer_soak(2_000)
+    assert result["sets"] == 2_000
+    assert len(result["stack_depths"]) == 1
+    assert result["passed"]
+
+
+def test_cycle_keeps_running_with_flat_memory():
+    assert run_cycle_soak(2_000)["passed"]
@@ -0,0 +1,85 @@
+import curses
+from collections import defaultdict
+from datetime import datetime
+
+import pytest
+
+from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.statistics_ui import StatisticsUI
+
+
+class FakeScreen:
+    """Rejects writes outside the window, like curses does."""
+
+    def __init__(self, width: int, height: int = 30):
+        self.width = width
+        self.height = height
+        self.rows: dict[int, str] = {}
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self.height, self.width
+
+    def addstr(self, y: int, x: int, text: str, attr: int = 0) -> None:
+        if not 0 <= y < self.height or x < 0 or x + len(text) > self.width:
+            raise curses.error("addwstr() returned ERR")
+        self.rows[y] = text
+
+    def move(self, y: int, x: int) -> None:
+        if not 0 <= y < self.height:
+            raise curses.error("wmove() returned ERR")
+
+    def clear(self) -> None:
+        self.rows = {}
+
+    def clrtoeol(self) -> None:
+        pass
+
+    def refresh(self) -> None:
+        pass
+
+
+class FakeStats:
+    def get_daily_work_minutes(self, start_date, end_date) -> dict:
+        return defaultdict(lambda: 0.1)
+
+    def get_totals(self, period: str) -> dict:
+        return {"work": 3, "short_break": 2, "long_break": 0, "total": 5}
+
+    def get_work_minutes(self, period: str) -> float:
+        return 75
+
+
+def heatmap(width: int, end: datetime) -> dict:
+    ui = StatisticsUI(FakeStats(), None, PomodoroConfig())
+    ui.heatmap_end = end
+    return ui._heatmap_lines(FakeScreen(width))
+
+
+def test_heatmap_total_is_rounded():
+    lines = heatmap(80, datetime(2026, 9, 28))
+    message = next(text for text, _ in lines.values() if "focused" in text)
+    # 259 days of 0.1 minutes, which adds up to 25.900000000000087 unrounded
+    assert message.startswith("You focused for 25.9 minutes!")
+
+
+def test_month_label_in_last_week_is_cut_to_the_grid():
+    # The last visible week starts on Monday 2026-06-01
+    lines = heatmap(40, datetime(2026, 6, 1))
+    rows = [text for text, _ in lines.values() if text.startswith(("    ", "Mon", "Sun"))]
+    month_row, day_rows = rows[0], rows[1:]
+    assert month_row.endswith("Ju")
+    assert len(month_row) == len(day_rows[0])
+
+
+@pytest.mark.parametrize("view", ["totals", "heatmap"])
+@pytest.mark.parametrize("width", [60, 40, 20])
+def test_narrow_terminals_get_cut_lines_instead_of_a_crash(monkeypatch, view, width):
+    monkeypatch.setattr(curses, "color_pair", lambda pair: 0)
+    ui = StatisticsUI(FakeStats(), None, PomodoroConfig())
+    ui.view = view
+    screen = FakeScreen(width, height=12)
+
+    ui._display(screen)
+
+    footer = screen.rows[screen.height - 3]
+    assert footer.startswith("[") and len(footer) == width
@@ -0,0 +1,91 @@
+import os
+import struct
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from pomodoro_timer import status_file
+from pomodoro_timer.status_file import StatusWriter, format_status, print_status, read_status
+
+
+@pytest.fixture
+def status_path(tmp_path):
+    return str(tmp_path / "status")
+
+
+def test_published_status_reads_back(status_path):
+    writer = StatusWriter(status_path)
+    writer.publish("running", phase="work", cycle=2, total_cycles=4,
+                   deadline=time.time() + 600, remaining=600, duration=1500)
+
+    status = read_status(status_path)
+    assert status["state"] == "running"
+    assert status["phase"] == "work"
+    assert (status["cycle"], status["total_cycles"], status["duration"]) == (2, 4, 1500)
+    assert 598 < status["remaining"] <= 600
+
+
+def test_paused_status_keeps_its_remaining_time(status_path):
+    writer = StatusWriter(status_path)
+    writer.publish("paused", phase="short_break", cycle=1, total_cycles=4, remaining=42.5, duration=300)
+    assert read_status(status_path)["remaining"] == 42.5
+
+
+def test_half_written_status_is_not_read(status_path):
+    writer = StatusWriter(status_path)
+    writer.publish("running", phase="work", cycle=1, total_cycles=4, deadline=time.time() + 60)
+
+    # An odd sequence number means the writer is part way through an update
+    struct.pack_into("<I", writer._map, 8, writer.seq + 1)
+    assert read_status(status_path) is None
+
+    struct.pack_into("<I", writer._map, 8, writer.seq)
+    assert read_status(status_path) is not None
+
+
+def test_idle_missing_or_foreign_status_reads_as_no_daemon(status_path, tmp_path):
+    assert read_status(status_path) is None
+
+    writer = StatusWriter(status_path)
+    writer.close()
+    assert read_status(status_path) is None
+
+    garbage = tmp_path / "garbage"
+    garbage.write_bytes(b"x" * status_file.STATUS_SIZE)
+    assert read_status(str(garbage)) is None
+
+
+def test_status_from_a_dead_daemon_is_ignored(status_path, monkeypatch):
+    child = subprocess.Popen(["true"])
+    child.wait()
+    monkeypatch.setattr(os, "getpid", lambda: child.pid)
+
+    StatusWriter(status_path).publish("running", phase="work", cycle=1, total_cycles=4,
+                                      deadline=time.time() + 60)
+    assert read_status(status_path) is None
+
+
+@pytest.mark.parametrize("status, line", [
+    ({"state": "running", "phase": "work", "remaining": 754.2, "cycle": 2, "total_cycles": 4}, "🍅 12:35 (2/4)"),
+    ({"state": "running", "phase": "short_break", "remaining": 0.0, "cycle": 1, "total_cycles": 4}, "☕ 00:00 (1/4)"),
+    ({"state": "paused", "phase": "work", "remaining": 60, "cycle": 3, "total_cycles": 4}, "⏸ 01:00 (3/4)"),
+    ({"state": "completed", "phase": "long_break", "remaining": 0, "cycle": 4, "total_cycles": 4}, "✨ done"),
+])
+def test_format_status(status, line):
+    assert format_status(status) == line
+
+
+def test_print_status_exit_code(status_path):
+    assert print_status(status_path) == 1
+
+
+def test_status_fast_path_imports_nothing_heavy():
+    code = "import sys, pomodoro_timer.main; print(sorted({'json', 're', 'curses'} & set(sys.modules)))"
+    # Wherever pytest was started, import the same package the tests use
+    package_root = Path(status_file.__file__).parents[1]
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=package_root)
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,82 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from pomodoro_timer.statistics import StatisticsManager
+from pomodoro_timer.storage import StorageManager, atomic_write
+
+
+def session(date: str, session_type: str = "work", duration: float = 25) -> dict:
+    return {"date": date, "type": session_type, "duration": duration, "partial": False}
+
+
+def test_torn_manifest_is_rebuilt_from_shards(home):
+    storage = StorageManager()
+    storage.append_session(session("2026-08-03T10:00:00"))
+    storage.append_session(session("2026-09-03T10:00:00"))
+
+    (storage.sessions_dir / storage.MANIFEST_FILE).write_text('{"version": 1, "sha')
+    storage.append_session(session("2026-10-03T10:00:00"))
+
+    assert storage.list_shards() == ["2026-08", "2026-09", "2026-10"]
+    assert StatisticsManager(storage).get_totals()["work"] == 3
+
+
+def test_missing_manifest_is_rebuilt(home):
+    storage = StorageManager()
+    storage.append_sessions([session("2026-08-03T10:00:00"), session("2026-08-04T10:00:00")])
+    (storage.sessions_dir / storage.MANIFEST_FILE).unlink()
+
+    manifest = storage.load_manifest()
+    assert manifest["shards"] == {"2026-08": {"sessions": 2}}
+    assert manifest["migrated"]
+
+
+def test_manifest_is_replaced_atomically(home):
+    storage = StorageManager()
+    storage.append_session(session(datetime.now().isoformat()))
+
+    leftovers = [path.name for path in storage.sessions_dir.iterdir() if path.name.endswith(".tmp")]
+    assert leftovers == []
+    assert json.loads((storage.sessions_dir / storage.MANIFEST_FILE).read_text())["shards"]
+
+
+def test_legacy_stats_are_migrated_once(home):
+    legacy = home / ".pomodoro" / "stats.json"
+    legacy.parent.mkdir()
+    legacy.write_text(json.dumps({"sessions": [session("2026-08-03T10:00:00")]}))
+
+    storage = StorageManager()
+    StorageManager()
+
+    assert storage.read_shard("2026-08") == [session("2026-08-03T10:00:00")]
+    assert not legacy.exists()
+
+
+@pytest.mark.parametrize("namespace", [".", "..", "...", ".hidden", "a/b", ""])
+def test_invalid_namespaces_are_rejected(home, namespace):
+    with pytest.raises(ValueError):
+        StorageManager(namespace=namespace)
+
+
+@pytest.mark.parametrize("namespace", ["alice", "room-a", "team_1", "v1.2"])
+def test_namespaces_get_their_own_directory(home, namespace):
+    storage = StorageManager(namespace=namespace)
+    assert storage.sessions_dir.parent == home / ".pomodoro" / "namespaces"
+    assert storage.sessions_dir.name == namespace
+
+
+def test_failed_atomic_write_keeps_the_old_file(tmp_path, monkeypatch):
+    path = tmp_path / "manifest.json"
+    atomic_write(path, "old")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("pomodoro_timer.storage.os.replace", fail)
+    with pytest.raises(OSError):
+        atomic_write(path, "new")
+
+    assert path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
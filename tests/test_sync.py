@@ -0,0 +1,213 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.scheduler import TimerScheduler
+from pomodoro_timer.statistics import StatisticsManager
+from pomodoro_timer.storage import StorageManager
+from pomodoro_timer.sync import SyncManager, start_sync
+
+
+@pytest.fixture
+def sync_dir(home):
+    path = home / "shared"
+    path.mkdir()
+    SyncManager.from_settings(StorageManager(), str(path))
+    return path
+
+
+def other_device_log(path, *seqs: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        for seq in seqs:
+            f.write(json.dumps({
+                "device": "laptop-1234", "seq": seq, "date": f"2026-10-0{seq}T09:00:00",
+                "type": "work", "duration": 25, "partial": False,
+            }) + "\n")
+
+
+def test_timers_added_to_the_scheduler_publish_and_merge(sync_dir):
+    scheduler = TimerScheduler(PomodoroConfig())
+    cycle = scheduler.add("writing", 0.0)
+    sync_manager = scheduler.sync_managers["writing"]
+
+    cycle.statistics_manager.record_session("work", 25)
+    published = sync_manager.log_path.read_text(encoding='utf-8').splitlines()
+    assert sync_manager.log_path.parent == sync_dir / "namespaces" / "writing"
+    assert json.loads(published[-1])["seq"] == 1
+
+    other_device_log(sync_manager.sync_dir / "laptop-1234.jsonl", 1, 2)
+    assert scheduler.merge_synced(30.0) == 0  # Merged on start; not due again yet
+
+    assert scheduler.merge_synced(60.0) == 2
+    assert scheduler.next_merge == 120.0
+    assert scheduler.merge_synced(90.0) == 0
+
+    scheduler.remove("writing", 1.0)
+    assert scheduler.sync_managers == {}
+
+
+def test_start_sync_merges_before_compacting(sync_dir, monkeypatch):
+    other_device_log(sync_dir / "laptop-1234.jsonl", 1, 2)
+    statistics_manager = StatisticsManager(StorageManager(), retention_days=30)
+    seen_by_compaction = []
+    monkeypatch.setattr(statistics_manager.retention, "start_background",
+                        lambda: seen_by_compaction.append(statistics_manager.get_totals()["work"]))
+
+    assert start_sync(statistics_manager, compact=False) is not None
+    assert seen_by_compaction == []
+
+    start_sync(statistics_manager)
+    assert seen_by_compaction == [2]
+
+
+@pytest.fixture
+def devices(tmp_path, monkeypatch):
+    """SyncManagers for separate machines sharing one folder, each with its own home."""
+    shared = tmp_path / "shared"
+    shared.mkdir()
+
+    def make(device_id: str) -> SyncManager:
+        monkeypatch.setenv("HOME", str(tmp_path / device_id))
+        return SyncManager(StorageManager(), shared, device_id=device_id)
+    return make
+
+
+def work(day: int, duration: float = 25) -> dict:
+    return {"date": f"2026-10-{day:02d}T09:00:00", "type": "work", "duration": duration, "partial": False}
+
+
+def test_conflicting_copies_resolve_the_same_whatever_their_names(devices):
+    laptop, desk = devices("laptop"), devices("desk")
+    laptop.publish([work(1)])
+    canonical = laptop.log_path.read_text(encoding='utf-8')
+    record = json.loads(canonical)
+
+    # Sorts before the real log, and claims the same (device, epoch, seq) with other contents
+    (laptop.sync_dir / "laptop (conflicted copy).jsonl").write_text(
+        json.dumps({**record, "duration": 20}) + "\n", encoding='utf-8'
+    )
+    (laptop.sync_dir / "laptop (another copy).jsonl").write_text(
+        json.dumps({**record, "duration": 30}) + "\n", encoding='utf-8'
+    )
+
+    assert desk.merge() == 1
+    assert [session["duration"] for session in desk.storage_manager.read_shard("2026-10")] == [25]
+
+    laptop.log_path.unlink()
+    other = devices("other")
+    assert other.merge() == 1
+    # Without the real log, the smallest record wins
+    assert [session["duration"] for session in other.storage_manager.read_shard("2026-10")] == [20]
+
+
+def test_rolled_back_log_does_not_reuse_seq_numbers(devices):
+    laptop, desk = devices("laptop"), devices("desk")
+    laptop.publish([work(1), work(2)])
+    assert desk.merge() == 2
+
+    # Restored from a backup taken after the first session
+    first_line = laptop.log_path.read_text(encoding='utf-8').splitlines()[0]
+    laptop.log_path.write_text(first_line + "\n", encoding='utf-8')
+    laptop.publish([work(3)])
+
+    records = [json.loads(line) for line in laptop.log_path.read_text(encoding='utf-8').splitlines()]
+    assert records[1]["epoch"] != records[0]["epoch"]
+    assert records[1]["seq"] == 1
+
+    assert desk.merge() == 1
+    assert [session["date"][:10] for session in desk.storage_manager.read_shard("2026-10")] == [
+        "2026-10-01", "2026-10-02", "2026-10-03"
+    ]
+
+
+def test_publishing_continues_the_current_epoch(devices):
+    laptop = devices("laptop")
+    laptop.publish([work(1)])
+    laptop.publish([work(2)])
+
+    records = [json.loads(line) for line in laptop.log_path.read_text(encoding='utf-8').splitlines()]
+    assert [record["seq"] for record in records] == [1, 2]
+    assert records[0]["epoch"] == records[1]["epoch"]
+
+
+def test_sessions_recorded_while_the_share_is_away_are_published_later(devices, capsys):
+    laptop, desk = devices("laptop"), devices("desk")
+    laptop.start()
+    laptop.publish_session(work(1))
+
+    shared = laptop.shared_dir
+    shared.rename(shared.with_name("unmounted"))
+    laptop.publish_session(work(2))
+    laptop.publish_session(work(3))
+    shared.with_name("unmounted").rename(shared)
+
+    # Nothing printed over a curses screen; the error waits to be reported
+    assert capsys.readouterr().err == ""
+    assert "will retry" in laptop.publish_error
+
+    laptop.start()
+    assert desk.merge() == 3
+    assert laptop.publish_backlog() == 0
+
+
+def test_backlog_goes_out_with_the_next_session(devices):
+    laptop, desk = devices("laptop"), devices("desk")
+    laptop.start()
+
+    shared = laptop.shared_dir
+    shared.rename(shared.with_name("unmounted"))
+    laptop.publish_session(work(1))
+    shared.with_name("unmounted").rename(shared)
+    laptop.publish_session(work(2))
+
+    assert desk.merge() == 2
+    seqs = [json.loads(line)["seq"] for line in laptop.log_path.read_text(encoding='utf-8').splitlines()]
+    assert seqs == [1, 2]
+
+
+def test_lost_log_is_not_republished_from_history(devices):
+    laptop, desk = devices("laptop"), devices("desk")
+    laptop.storage_manager.append_session(work(1))
+    laptop.start()
+    assert desk.merge() == 1
+
+    # Everything already reached the other devices, so nothing is shared twice
+    laptop.log_path.unlink()
+    laptop.start()
+    assert desk.merge() == 0
+
+    laptop.publish_session(work(2))
+    assert desk.merge() == 1
+
+
+def test_query_counts_other_devices_without_writing(devices):
+    from pomodoro_timer.query import SessionQuery
+
+    laptop, desk = devices("laptop"), devices("desk")
+    laptop.publish([work(1), work(2, duration=50)])
+    desk.storage_manager.append_session(work(2))
+    before = {path: path.read_bytes() for path in desk.storage_manager.base_dir.rglob("*") if path.is_file()}
+
+    unmerged = desk.unmerged()
+    rows = list(SessionQuery(desk.storage_manager, unmerged).rows(None, datetime(2026, 10, 31).date(), "day"))
+    assert [(row["period"], row["work"], row["work_minutes"]) for row in rows] == [
+        ("2026-10-01", 1, 25), ("2026-10-02", 2, 75)
+    ]
+
+    # Only the query index cache is new; no shard, sync state or manifest was touched
+    after = {path: path.read_bytes() for path in desk.storage_manager.base_dir.rglob("*")
+             if path.is_file() and ".index" not in path.parts}
+    assert after == before
+    assert desk.unmerged() == unmerged
+
+
+def test_missing_share_is_not_created(tmp_path, home):
+    share = tmp_path / "unmounted"
+    sync_manager = SyncManager(StorageManager(), share, device_id="desk")
+
+    assert sync_manager.start() == 0
+    sync_manager.publish_session(work(1))
+    assert not share.exists()
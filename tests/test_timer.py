@@ -0,0 +1,35 @@
+import curses
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("playsound")  # The full-screen timer pulls in the sound manager
+
+from pomodoro_timer import clock
+from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.timer import PomodoroTimer
+
+
+class KeyWindow:
+    def __init__(self, keys):
+        self.keys = list(keys)
+
+    def getch(self) -> int:
+        return self.keys.pop(0) if self.keys else -1
+
+
+def test_keys_pressed_while_a_screen_is_held_reach_the_countdown():
+    timer = PomodoroTimer(PomodoroConfig(), None, None, None)
+    timer.stdscr = KeyWindow([-1, ord('p'), ord('q')])
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    with mock.patch.object(clock, "sleep", sleep), mock.patch.object(clock, "monotonic", lambda: now[0]), \
+            mock.patch.object(curses, "ungetch") as ungetch:
+        timer._hold_screen("Time to focus!", 2)
+
+    ungetch.assert_called_once_with(ord('p'))
+    assert now[0] >= 2  # Still shown for its full time
+    assert timer.stdscr.keys == [ord('q')]
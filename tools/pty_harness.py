@@ -0,0 +1,189 @@
+"""Drive ``pomodoro-init`` inside a pseudo-terminal and measure what the user sees.
+
+Run with ``python -m tools.pty_harness``. The timer is started with
+a sped-up clock (POMODORO_CLOCK_SCALE) in a throwaway HOME, keystrokes are
+scripted, and the harness reports bytes per frame, frames per second and the
+delay between pressing a key and the resulting screen being painted.
+"""
+import argparse
+import fcntl
+import json
+import os
+import pty
+import select
+import signal
+import statistics
+import struct
+import sys
+import tempfile
+import termios
+import time
+
+
+# Bytes arriving closer together than this are treated as one painted frame
+FRAME_GAP_SECONDS = 0.003
+
+READY_MARKERS = {"full": b"Press [P] to Pause", "compact": b"Work 1/"}
+PAUSED_MARKERS = {"full": b"TIMER PAUSED", "compact": b"(paused)"}
+
+
+class PtySession:
+    """A child process attached to a pty, with every output chunk timestamped."""
+
+    def __init__(self, argv: list, env: dict, rows: int, cols: int):
+        self.pid, self.fd = pty.fork()
+        if self.pid == 0:
+            os.execvpe(argv[0], argv, env)
+
+        fcntl.ioctl(self.fd, termios.TIOCSWINSZ, struct.pack("HHHH", rows, cols, 0, 0))
+        self.chunks: list[tuple[float, bytes]] = []
+        self.closed = False
+
+    @property
+    def output(self) -> bytes:
+        return b"".join(chunk for _, chunk in self.chunks)
+
+    def pump(self, seconds: float) -> None:
+        """Collect output for the given number of real seconds."""
+        deadline = time.perf_counter() + seconds
+        while not self.closed:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            self._read(remaining)
+
+    def wait_for(self, marker: bytes, since: int = 0, timeout: float = 10.0) -> float:
+        """Block until `marker` shows up in output after chunk index `since`; return when it did."""
+        deadline = time.perf_counter() + timeout
+        while not self.closed and time.perf_counter() < deadline:
+            for stamp, chunk in self.chunks[since:]:
+                if marker in chunk:
+                    return stamp
+            # Markers can straddle two reads, so also search the joined tail
+            tail = b"".join(chunk for _, chunk in self.chunks[since:])
+            if marker in tail:
+                return self.chunks[-1][0]
+            self._read(deadline - time.perf_counter())
+        raise TimeoutError(f"{marker!r} did not appear within {timeout}s")
+
+    def send(self, keys: bytes) -> float:
+        sent_at = time.perf_counter()
+        os.write(self.fd, keys)
+        return sent_at
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                os.kill(self.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        try:
+            os.waitpid(self.pid, 0)
+        except ChildProcessError:
+            pass
+        os.close(self.fd)
+
+    def _read(self, timeout: float) -> None:
+        ready, _, _ = select.select([self.fd], [], [], max(0.0, timeout))
+        if not ready:
+            return
+        try:
+            data = os.read(self.fd, 65536)
+        except OSError:
+            data = b""
+        if not data:
+            self.closed = True
+            return
+        self.chunks.append((time.perf_counter(), data))
+
+
+def group_frames(chunks: list, gap: float = FRAME_GAP_SECONDS) -> list[tuple[float, int]]:
+    """Merge output chunks that arrive within `gap` of each other into (start, bytes) frames."""
+    frames = []
+    last_stamp = None
+    for stamp, chunk in chunks:
+        if frames and stamp - last_stamp <= gap:
+            start, size = frames[-1]
+            frames[-1] = (start, size + len(chunk))
+        else:
+            frames.append((stamp, len(chunk)))
+        last_stamp = stamp
+    return frames
+
+
+def run_benchmark(args: argparse.Namespace) -> dict:
+    env = dict(os.environ)
+    env.update({
+        "TERM": args.term,
+        "POMODORO_CLOCK_SCALE": str(args.scale),
+        "HOME": tempfile.mkdtemp(prefix="pomodoro-bench-"),
+        "PYTHONUNBUFFERED": "1",
+    })
+    argv = [sys.executable, "-m", "pomodoro_timer.main", "--display", args.display,
+            "--work", str(args.work), *args.timer_args]
+
+    session = PtySession(argv, env, args.rows, args.cols)
+    try:
+        session.wait_for(READY_MARKERS[args.display], timeout=args.timeout)
+
+        # Steady state: just let the countdown tick
+        steady_start = len(session.chunks)
+        session.pump(args.steady_seconds)
+        steady_frames = group_frames(session.chunks[steady_start:])
+
+        latencies = []
+        for _ in range(args.pauses):
+            since = len(session.chunks)
+            sent_at = session.send(b"p")
+            painted_at = session.wait_for(PAUSED_MARKERS[args.display], since, timeout=args.timeout)
+            latencies.append((painted_at - sent_at) * 1000)
+            session.pump(0.05)
+            session.send(b"r" if args.display == "full" else b"p")
+            session.pump(0.2)
+
+        session.send(b"q" if args.display == "compact" else b"pq")
+        session.pump(1.0)
+    finally:
+        session.close()
+
+    frame_sizes = [size for _, size in steady_frames]
+    duration = steady_frames[-1][0] - steady_frames[0][0] if len(steady_frames) > 1 else 0
+
+    return {
+        "display": args.display,
+        "clock_scale": args.scale,
+        "terminal": f"{args.cols}x{args.rows}",
+        "steady_frames": len(frame_sizes),
+        "frames_per_second": round((len(frame_sizes) - 1) / duration, 2) if duration else 0,
+        "bytes_per_frame_mean": round(statistics.mean(frame_sizes), 1) if frame_sizes else 0,
+        "bytes_per_frame_median": statistics.median(frame_sizes) if frame_sizes else 0,
+        "bytes_per_frame_max": max(frame_sizes, default=0),
+        "bytes_total": len(session.output),
+        "pause_latency_ms": [round(latency, 2) for latency in latencies],
+        "pause_latency_ms_median": round(statistics.median(latencies), 2) if latencies else None,
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure pomodoro-init's terminal output in a pty")
+    parser.add_argument("--display", choices=["full", "compact"], default="full")
+    parser.add_argument("--scale", type=float, default=60.0,
+                        help="Clock speed-up; input polling scales too, so use 1 for real-world latency")
+    parser.add_argument("--work", type=int, default=25, metavar="MINUTES")
+    parser.add_argument("--steady-seconds", type=float, default=3.0,
+                        help="Real seconds of countdown to record before pausing")
+    parser.add_argument("--pauses", type=int, default=5, help="How many pause keypresses to time")
+    parser.add_argument("--rows", type=int, default=40)
+    parser.add_argument("--cols", type=int, default=120)
+    parser.add_argument("--term", default="xterm-256color")
+    parser.add_argument("--timeout", type=float, default=15.0)
+    parser.add_argument("timer_args", nargs="*", help="Extra arguments passed to pomodoro-init (after --)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    print(json.dumps(run_benchmark(parse_args(argv)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Soak check for continuous mode: run many auto-continued sets and watch the stack and memory.
+
+Run from the repository root with ``python -m tools.soak``. Two loops are
+exercised with a fake clock, so 100,000 sets take seconds rather than years:
+
+- ``PomodoroTimer``'s set loop (``_run_timer_loop``), the full-screen timer
+  that used to start every new set from inside the previous one, driven
+  through a fake curses window. Stack depth is sampled in every
+  ``_run_pomodoro_set`` and must never change.
+- ``PomodoroCycle``, the headless state machine behind the daemon and the
+  line display.
+
+Memory is sampled with tracemalloc after a warm-up, and the run fails if it
+keeps growing.
+"""
+import argparse
+import curses
+import inspect
+import sys
+import tracemalloc
+from unittest import mock
+
+from pomodoro_timer import clock
+from pomodoro_timer.config import PomodoroConfig
+from pomodoro_timer.pomodoro_cycle import PomodoroCycle
+from pomodoro_timer.timer import PomodoroTimer
+from pomodoro_timer.timer_state import TimerState
+
+
+class SessionCounter:
+    """Stands in for StatisticsManager so the soak measures the timer, not disk writes."""
+
+    def __init__(self):
+        self.sessions = 0
+
+    def record_session(self, session_type: str, duration: float, *args, **kwargs) -> None:
+        self.sessions += 1
+
+
+class FakeWindow:
+    """Just enough of a curses window for PomodoroTimer: a fixed size and no keypresses."""
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return 40, 120
+
+    def getch(self) -> int:
+        return -1
+
+    def _ignore(self, *args) -> None:
+        pass
+
+    addstr = move = clrtoeol = clear = refresh = nodelay = keypad = _ignore
+
+
+class FakeThemes:
+    def load_logo(self) -> str:
+        return ""
+
+    def load_ascii_art(self, theme: str, session_type: str) -> str:
+        return ""
+
+    def get_curses_color(self, color: str) -> int:
+        return 0
+
+
+class SilentSounds:
+    def play_notification(self) -> None:
+        pass
+
+
+def _ignore(*args) -> None:
+    pass
+
+
+class FakeClock:
+    """Each sleep moves time forward instead of waiting."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class SoakTimer(PomodoroTimer):
+    """Samples the call stack depth and memory at the start of every set."""
+
+    def __init__(self, *args, samples: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sets_started = 0
+        self.stack_depths: set[int] = set()
+        self.checkpoint = max(1, self.config.sets // samples)
+        self.memory: list[int] = []
+
+    def _run_pomodoro_set(self) -> TimerState:
+        if self.sets_started % self.checkpoint == 0:
+            self.stack_depths.add(len(inspect.stack(0)))
+            self.memory.append(tracemalloc.get_traced_memory()[0])
+        self.sets_started += 1
+        return super()._run_pomodoro_set()
+
+
+def run_timer_soak(sets: int, samples: int = 10, tolerance_bytes: int = 64 * 1024) -> dict:
+    config = PomodoroConfig()
+    config.auto_continue = True
+    config.sets = sets
+    # Zero-length phases: the countdown never recursed, the loop between sets did
+    config.work_mins = config.short_break_mins = config.long_break_mins = 0
+    config.number_of_cycles = 1
+
+    counter = SessionCounter()
+    timer = SoakTimer(config, FakeThemes(), SilentSounds(), counter, samples=samples)
+    fake_clock = FakeClock()
+
+    with mock.patch.object(clock, "sleep", fake_clock.sleep), \
+            mock.patch.object(clock, "monotonic", fake_clock.monotonic), \
+            mock.patch.multiple(curses, curs_set=_ignore, has_colors=lambda: False,
+                                echo=_ignore, noecho=_ignore, update_lines_cols=_ignore):
+        tracemalloc.start()
+        try:
+            timer._run_timer_loop(FakeWindow())
+        finally:
+            tracemalloc.stop()
+
+    steady = timer.memory[1:] or timer.memory
+    growth = max(steady) - min(steady) if steady else 0
+    return {
+        "sets": timer.sets_started,
+        "sessions_recorded": counter.sessions,
+        "stack_depths": sorted(timer.stack_depths),
+        "memory_samples": timer.memory,
+        "memory_growth_bytes": growth,
+        "passed": timer.sets_started == sets and len(timer.stack_depths) == 1 and growth <= tolerance_bytes,
+    }
+
+
+def run_cycle_soak(sets: int, samples: int = 10, tolerance_bytes: int = 64 * 1024) -> dict:
+    config = PomodoroConfig()
+    config.auto_continue = True
+
+    counter = SessionCounter()
+    cycle = PomodoroCycle(config, counter)
+    now = 0.0
+    cycle.start(now)
+
+    checkpoint = max(1, sets // samples)
+    memory = []
+    tracemalloc.start()
+    try:
+        while cycle.sets_completed < sets:
+            # Jump straight to the next deadline, with an occasional pause/resume along the way
+            if cycle.index == 1 and cycle.sets_completed % 7 == 0:
+                cycle.pause(now)
+                cycle.resume(now + 30)
+            now = cycle.next_deadline
+            cycle.advance(now)
+
+            if cycle.index == 0 and cycle.sets_completed % checkpoint == 0:
+                memory.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        tracemalloc.stop()
+
+    # The first sample includes one-off allocations (e.g. the interpreter warming up)
+    steady = memory[1:] or memory
+    growth = max(steady) - min(steady) if steady else 0
+    return {
+        "sets": cycle.sets_completed,
+        "sessions_recorded": counter.sessions,
+        "still_running": cycle.state == TimerState.RUNNING,
+        "memory_samples": memory,
+        "memory_growth_bytes": growth,
+        "passed": cycle.state == TimerState.RUNNING and growth <= tolerance_bytes,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Soak-test continuous Pomodoro sets under a fake clock")
+    parser.add_argument("--sets", type=int, default=100_000)
+    parser.add_argument("--tolerance-kb", type=int, default=64,
+                        help="Allowed spread in traced memory after warm-up")
+    args = parser.parse_args(argv)
+
+    passed = True
+    for name, soak in (("PomodoroTimer", run_timer_soak), ("PomodoroCycle", run_cycle_soak)):
+        result = soak(args.sets, tolerance_bytes=args.tolerance_kb * 1024)
+        print(f"{name}:")
+        for key, value in result.items():
+            print(f"  {key}: {value}")
+        passed = passed and result["passed"]
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()